@@ -159,7 +159,7 @@ def demo_materialized_views() -> pd.DataFrame:
 
 
 # ---------------------------------------------------------------------------
-# demo_storage_metrics  ->  fetch_storage_metrics
+# demo_storage_metrics  ->  fetch_storage_detail (one row per table)
 # ---------------------------------------------------------------------------
 
 _STORAGE = [
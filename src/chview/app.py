@@ -8,22 +8,27 @@ This module is the thin top-level entry point.  It:
   5. Dispatches to the appropriate page function.
 """
 
+import os
+from typing import Any, Optional
+
 import streamlit as st
 
 st.set_page_config(page_title="CHView", page_icon="📊", layout="wide")
 
 import pandas as pd  # noqa: E402  (must come after set_page_config)
 
+from chview import pages  # noqa: E402  (page modules load on first use)
 from chview.components.sidebar import (  # noqa: E402
     render_connection_status,
     render_sidebar_nav,
 )
 from chview.components.styles import inject_custom_css  # noqa: E402
-from chview.db.repository import ClickHouseRepository  # noqa: E402
-from chview.pages.lineage import render_lineage_page  # noqa: E402
-from chview.pages.metrics import render_metrics_page  # noqa: E402
-from chview.pages.overview import render_overview_page  # noqa: E402
-from chview.pages.tables import render_tables_page  # noqa: E402
+from chview.core.models import ThroughputTotals  # noqa: E402
+from chview.db.repository import (  # noqa: E402
+    ClickHouseRepository,
+    DashboardBundle,
+    fetch_dashboard_bundle,
+)
 
 # ---------------------------------------------------------------------------
 # CSS
@@ -47,68 +52,92 @@ if "selected_database" not in st.session_state:
 
 _repo = ClickHouseRepository()
 
+# Schema and DDL change rarely, so they can be cached longer than metrics
+_METADATA_TTL = int(os.getenv("CHVIEW_METADATA_TTL", "300"))
+
 # ---------------------------------------------------------------------------
 # Cached data loaders
 # ---------------------------------------------------------------------------
 
 
-@st.cache_data(ttl=120)
-def load_schema(database=None):
+# No spinner on the schema, cluster-info and MV-error loaders: the overview
+# runs them on fetch threads, which have no page to draw one on
+@st.cache_data(ttl=_METADATA_TTL, show_spinner=False)
+def load_schema(database: Optional[str] = None) -> pd.DataFrame:
     return _repo.fetch_schema(database)
 
 
 @st.cache_data(ttl=300)
-def load_storage_metrics(database=None):
-    return _repo.fetch_storage_metrics(database)
+def load_storage_detail(database: str, table: str) -> pd.DataFrame:
+    return _repo.fetch_storage_detail(database, table)
 
 
-@st.cache_data(ttl=120)
-def load_materialized_views(database=None):
+@st.cache_data(ttl=_METADATA_TTL)
+def load_materialized_views(database: Optional[str] = None) -> pd.DataFrame:
     return _repo.fetch_materialized_views(database)
 
 
 @st.cache_data(ttl=300)
-def load_throughput(hours=24, database=None):
+def load_throughput(hours: int = 24, database: Optional[str] = None) -> pd.DataFrame:
     return _repo.fetch_mv_throughput(hours, database)
 
 
-@st.cache_data(ttl=120)
-def load_cluster_info(database=None):
+@st.cache_data(ttl=300)
+def load_throughput_totals(
+    hours: int = 24, database: Optional[str] = None
+) -> ThroughputTotals:
+    return _repo.fetch_throughput_totals(hours, database)
+
+
+@st.cache_data(ttl=120, show_spinner=False)
+def load_cluster_info(database: Optional[str] = None) -> dict[str, Any]:
     return _repo.fetch_cluster_info(database)
 
 
+def load_dashboard_bundle(database: Optional[str] = None) -> DashboardBundle:
+    # Not cached itself: a failed loader raises out of its own cache, so only
+    # the sections that loaded are kept and the rest are retried next rerun
+    return fetch_dashboard_bundle(
+        load_cluster_info, load_schema, load_mv_errors, database
+    )
+
+
 @st.cache_data(ttl=300)
-def load_partition_storage(database=None):
+def load_partition_storage(database: Optional[str] = None) -> pd.DataFrame:
     return _repo.fetch_partition_storage(database)
 
 
 @st.cache_data(ttl=300)
-def load_recent_throughput(minutes=30, database=None):
+def load_recent_throughput(
+    minutes: int = 30, database: Optional[str] = None
+) -> pd.DataFrame:
     return _repo.fetch_recent_throughput(minutes, database)
 
 
-@st.cache_data(ttl=60)
-def load_mv_errors(hours=24, database=None):
+@st.cache_data(ttl=60, show_spinner=False)
+def load_mv_errors(
+    hours: int = 24, database: Optional[str] = None
+) -> Optional[pd.DataFrame]:
     return _repo.fetch_mv_errors(hours, database)
 
 
 @st.cache_data(ttl=60)
-def load_kafka_consumers(database=None):
+def load_kafka_consumers(database: Optional[str] = None) -> Optional[pd.DataFrame]:
     return _repo.fetch_kafka_consumers(database)
 
 
-@st.cache_data(ttl=120)
-def load_create_table(database, table):
+@st.cache_data(ttl=_METADATA_TTL)
+def load_create_table(database: str, table: str) -> str:
     return _repo.fetch_create_table(database, table)
 
 
-@st.cache_data(ttl=120)
-def load_create_view(database, view):
+@st.cache_data(ttl=_METADATA_TTL)
+def load_create_view(database: str, view: str) -> str:
     return _repo.fetch_create_view(database, view)
 
 
 @st.cache_data(ttl=300)
-def load_databases():
+def load_databases() -> list[str]:
     return _repo.fetch_databases()
 
 
@@ -142,19 +171,20 @@ render_sidebar_nav(
 if success:
     page = st.session_state.get("current_page", "overview")
     selected_db = st.session_state.get("selected_database", "All")
+    # "All" is the selector's sentinel; pages and loaders take None for it
+    if selected_db == "All":
+        selected_db = None
 
     if page == "overview":
-        render_overview_page(
-            load_cluster_info=load_cluster_info,
-            load_schema=load_schema,
-            load_mv_errors=load_mv_errors,
+        pages.render_overview_page(
+            load_dashboard_bundle=load_dashboard_bundle,
             database=selected_db,
         )
     elif page == "lineage":
-        render_lineage_page(
+        pages.render_lineage_page(
             load_materialized_views=load_materialized_views,
             load_schema=load_schema,
-            load_storage_metrics=load_storage_metrics,
+            load_storage_detail=load_storage_detail,
             load_recent_throughput=load_recent_throughput,
             load_mv_errors=load_mv_errors,
             load_kafka_consumers=load_kafka_consumers,
@@ -163,8 +193,9 @@ if success:
             database=selected_db,
         )
     elif page == "metrics":
-        render_metrics_page(
+        pages.render_metrics_page(
             load_throughput=load_throughput,
+            load_throughput_totals=load_throughput_totals,
             load_mv_errors=load_mv_errors,
             load_kafka_consumers=load_kafka_consumers,
             database=selected_db,
@@ -176,17 +207,15 @@ if success:
             except Exception:
                 schema_df = pd.DataFrame()
 
-        render_tables_page(
+        pages.render_tables_page(
             schema_df=schema_df,
-            load_storage_metrics=load_storage_metrics,
+            load_storage_detail=load_storage_detail,
             load_partition_storage=load_partition_storage,
             database=selected_db,
         )
     else:
-        render_overview_page(
-            load_cluster_info=load_cluster_info,
-            load_schema=load_schema,
-            load_mv_errors=load_mv_errors,
+        pages.render_overview_page(
+            load_dashboard_bundle=load_dashboard_bundle,
             database=selected_db,
         )
 
@@ -1,15 +1,16 @@
-"""UI components public API."""
+"""UI components public API.
+
+Chart components are imported on first access (PEP 562) so that using the
+other components does not load Plotly.
+"""
+
+from typing import TYPE_CHECKING, Any
 
 from chview.components.alerts import (
     render_kafka_consumers,
     render_mv_errors_table,
     render_mv_health_banner,
 )
-from chview.components.charts import (
-    render_engine_pie_chart,
-    render_storage_treemap,
-    render_throughput_charts,
-)
 from chview.components.sidebar import (
     render_connection_status,
     render_database_selector,
@@ -17,6 +18,14 @@ from chview.components.sidebar import (
     render_sidebar_nav,
 )
 from chview.components.styles import inject_custom_css
+
+if TYPE_CHECKING:
+    from chview.components.charts import (
+        render_engine_pie_chart,
+        render_storage_treemap,
+        render_throughput_charts,
+    )
+
 from chview.components.tables import (
     render_metrics_cards,
     render_node_detail,
@@ -43,3 +52,15 @@ __all__ = [
     "render_table_detail",
     "render_throughput_charts",
 ]
+
+_CHART_EXPORTS = frozenset(
+    {"render_engine_pie_chart", "render_storage_treemap", "render_throughput_charts"}
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _CHART_EXPORTS:
+        from chview.components import charts
+
+        return getattr(charts, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,9 +2,18 @@
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+# Kafka consumer status → indicator color
+_STATUS_COLORS = {
+    "Healthy": "#10B77A",
+    "Warning": "#F47B16",
+    "Error": "#FF5C4D",
+    "Inactive": "#A4ABBA",
+}
+
 
 def render_mv_health_banner(error_df: Optional[pd.DataFrame]) -> None:
     """Render an alert banner showing MV health status.
@@ -40,8 +49,14 @@ def render_mv_errors_table(error_df: Optional[pd.DataFrame]) -> None:
 
     display_df = error_df[
         ["view_name", "exception_code", "exception", "event_time"]
-    ].copy()
-    display_df.columns = ["View", "Code", "Exception", "Time"]
+    ].rename(
+        columns={
+            "view_name": "View",
+            "exception_code": "Code",
+            "exception": "Exception",
+            "event_time": "Time",
+        }
+    )
     st.dataframe(display_df, use_container_width=True, hide_index=True)
 
 
@@ -54,55 +69,35 @@ def render_kafka_consumers(kafka_df: Optional[pd.DataFrame]) -> None:
     if kafka_df is None or kafka_df.empty:
         return
 
-    from chview.core.formatters import format_number
+    from chview.core.formatters import format_number_array, format_timestamp_ago
 
     st.subheader("Kafka Consumer Health")
 
-    display_df = kafka_df.copy()
-
-    def _health_status(row: pd.Series) -> str:
-        if not row.get("is_currently_used", True):
-            return "Inactive"
-        secs = row.get("seconds_since_poll", 0)
-        if secs > 300:
-            return "Error"
-        if secs > 60:
-            return "Warning"
-        return "Healthy"
-
-    display_df["status"] = display_df.apply(_health_status, axis=1)
-
-    def _status_color(status: str) -> str:
-        return {
-            "Healthy": "#10B77A",
-            "Warning": "#F47B16",
-            "Error": "#FF5C4D",
-            "Inactive": "#A4ABBA",
-        }.get(status, "#A4ABBA")
-
-    for _, row in display_df.iterrows():
-        table_name = f"{row['database']}.{row['table']}"
-        status = row["status"]
-        color = _status_color(status)
-
-        with st.expander(f"{table_name} — {row.get('topic', 'N/A')} [{status}]"):
-            c1, c2, c3, c4 = st.columns(4)
-            with c1:
-                st.markdown(
-                    f"**Status:** <span style='color:{color}'>{status}</span>",
-                    unsafe_allow_html=True,
-                )
-            with c2:
-                st.metric(
-                    "Messages Read", format_number(row.get("num_messages_read", 0))
-                )
-            with c3:
-                st.metric("Rebalances", int(row.get("rebalance_count", 0)))
-            with c4:
-                secs = row.get("seconds_since_poll", 0)
-                if secs < 60:
-                    st.metric("Last Poll", f"{secs:.0f}s ago")
-                elif secs < 3600:
-                    st.metric("Last Poll", f"{secs / 60:.1f}m ago")
-                else:
-                    st.metric("Last Poll", f"{secs / 3600:.1f}h ago")
+    def _column(name: str, default: object) -> pd.Series:
+        if name in kafka_df:
+            return kafka_df[name]
+        return pd.Series(default, index=kafka_df.index)
+
+    used = _column("is_currently_used", True).fillna(True).to_numpy(dtype=bool)
+    secs = _column("seconds_since_poll", 0).to_numpy(dtype=float)
+    statuses = np.select(
+        [~used, secs > 300, secs > 60], ["Inactive", "Error", "Warning"], "Healthy"
+    )
+
+    # One table for all consumers instead of an expander of metrics per consumer
+    display_df = pd.DataFrame(
+        {
+            "Table": kafka_df["database"].astype(str)
+            + "."
+            + kafka_df["table"].astype(str),
+            "Topic": _column("topic", "N/A").to_numpy(),
+            "Status": statuses,
+            "Messages Read": format_number_array(_column("num_messages_read", 0)),
+            "Rebalances": _column("rebalance_count", 0).fillna(0).to_numpy(dtype=int),
+            "Last Poll": [format_timestamp_ago(x) for x in secs],
+        }
+    )
+    styled = display_df.style.map(
+        lambda status: f"color: {_STATUS_COLORS[status]}", subset=["Status"]
+    )
+    st.dataframe(styled, use_container_width=True, hide_index=True)
@@ -1,11 +1,19 @@
 """Plotly chart rendering components."""
 
-from typing import Optional
+import contextlib
+import copy
+import functools
+from types import MappingProxyType
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+
+from chview.core.formatters import format_bytes_array, format_number_array
 
 # F0 design system colors for Plotly (hex – CSS vars don't work in Plotly)
 _F0 = {
@@ -25,45 +33,71 @@ _F0_CATEGORICAL = [
 ]
 _F0_TREEMAP_SCALE = ["#E8F8F7", "#07A4AE"]
 
+# Largest partitions kept per table in the treemap; the rest become "(others)"
+_TREEMAP_TOP_PARTITIONS = 20
 
-def render_throughput_charts(
-    throughput_df: pd.DataFrame, selected_mv: Optional[str] = None
-) -> None:
-    """Render throughput charts using Plotly area charts.
+# Plotly.js configs for charts that don't need zoom/pan
+_NO_MODEBAR_CONFIG = {"displayModeBar": False, "responsive": True}
+_STATIC_CONFIG = {"staticPlot": True, "responsive": True}
 
-    Args:
-        throughput_df: DataFrame with throughput data
-        selected_mv: Optional MV name to filter to
-    """
-    if throughput_df is None or throughput_df.empty:
-        st.info("No throughput data available for charts.")
-        return
+# Layout scaffolding shared by the throughput area charts (read-only)
+_BASE_LAYOUT: MappingProxyType[str, Any] = MappingProxyType(
+    {
+        "paper_bgcolor": "rgba(0,0,0,0)",
+        "plot_bgcolor": "rgba(0,0,0,0)",
+        "margin": {"t": 10, "b": 40, "l": 60, "r": 10},
+        "xaxis": {"showgrid": False},
+        "yaxis": {"showgrid": True, "gridcolor": _F0["grid"]},
+    }
+)
 
-    df = throughput_df.copy()
-    if selected_mv and selected_mv != "All":
-        df = df[df["view_name"] == selected_mv]
 
-    if df.empty:
-        st.info(f"No data for {selected_mv}.")
-        return
+def _aggregate_by_time(df: pd.DataFrame, time_col: str) -> pd.DataFrame:
+    """Sum rows written/read and average duration per time bucket.
 
-    time_col = "interval_start" if "interval_start" in df.columns else "hour"
-    if time_col not in df.columns:
-        st.info("No time series data available.")
-        return
+    Sorts once by time and reduces contiguous runs with ``np.add.reduceat``,
+    which avoids the hash partitioning of ``groupby`` on this hot path.
+    """
+    order = np.argsort(df[time_col].to_numpy(), kind="stable")
+    t = df[time_col].to_numpy()[order]
+    written = df["rows_written"].to_numpy()[order]
+    read = df["rows_read"].to_numpy()[order]
+    duration = df["avg_duration_ms"].to_numpy(dtype=float)[order]
 
-    chart_data = df.groupby(time_col)[["rows_written", "rows_read"]].sum().reset_index()
+    starts = np.concatenate(([0], np.flatnonzero(t[1:] != t[:-1]) + 1))
+    has_duration = ~np.isnan(duration)
+    duration_sum = np.add.reduceat(np.where(has_duration, duration, 0.0), starts)
+    duration_count = np.add.reduceat(has_duration.astype(np.int64), starts)
 
-    # Rows written/read area chart
-    st.markdown(
-        '<div class="lenses-card-title">Rows per 5-Minute Interval</div>',
-        unsafe_allow_html=True,
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_duration = duration_sum / duration_count
+
+    return pd.DataFrame(
+        {
+            time_col: t[starts],
+            "rows_written": np.add.reduceat(written, starts),
+            "rows_read": np.add.reduceat(read, starts),
+            "avg_duration_ms": avg_duration,
+        }
     )
+
+
+def _filter_view(df: pd.DataFrame, view_name: str) -> pd.DataFrame:
+    """Keep the rows of one MV.
+
+    Compares with ``==`` on the Series rather than on ``to_numpy()`` so a
+    categorical ``view_name`` is matched on its integer codes instead of being
+    materialized as an object array first.
+    """
+    return df.iloc[np.flatnonzero((df["view_name"] == view_name).to_numpy())]
+
+
+@functools.lru_cache(maxsize=1)
+def _rows_figure_template() -> go.Figure:
+    """Build the styled, data-less rows written/read figure (copy before use)."""
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
-            x=chart_data[time_col],
-            y=chart_data["rows_written"],
             name="Rows Written",
             fill="tozeroy",
             fillcolor="rgba(229, 23, 69, 0.15)",
@@ -73,8 +107,6 @@ def render_throughput_charts(
     )
     fig.add_trace(
         go.Scatter(
-            x=chart_data[time_col],
-            y=chart_data["rows_read"],
             name="Rows Read",
             fill="tozeroy",
             fillcolor="rgba(7, 164, 174, 0.15)",
@@ -83,9 +115,7 @@ def render_throughput_charts(
         )
     )
     fig.update_layout(
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        margin={"t": 10, "b": 40, "l": 60, "r": 10},
+        **_BASE_LAYOUT,
         height=300,
         legend={
             "orientation": "h",
@@ -94,22 +124,16 @@ def render_throughput_charts(
             "xanchor": "right",
             "x": 1,
         },
-        xaxis={"showgrid": False},
-        yaxis={"showgrid": True, "gridcolor": _F0["grid"]},
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
-    # Duration chart
-    st.markdown(
-        '<div class="lenses-card-title">Average Duration (ms)</div>',
-        unsafe_allow_html=True,
-    )
-    duration_data = df.groupby(time_col)["avg_duration_ms"].mean().reset_index()
-    fig2 = go.Figure()
-    fig2.add_trace(
+
+@functools.lru_cache(maxsize=1)
+def _duration_figure_template() -> go.Figure:
+    """Build the styled, data-less average duration figure (copy before use)."""
+    fig = go.Figure()
+    fig.add_trace(
         go.Scatter(
-            x=duration_data[time_col],
-            y=duration_data["avg_duration_ms"],
             name="Avg Duration",
             fill="tozeroy",
             fillcolor="rgba(229, 23, 69, 0.08)",
@@ -117,40 +141,138 @@ def render_throughput_charts(
             mode="lines",
         )
     )
-    fig2.update_layout(
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        margin={"t": 10, "b": 40, "l": 60, "r": 10},
+    fig.update_layout(
+        {**_BASE_LAYOUT, "yaxis": {**_BASE_LAYOUT["yaxis"], "title": "ms"}},
         height=250,
-        xaxis={"showgrid": False},
-        yaxis={"showgrid": True, "gridcolor": _F0["grid"], "title": "ms"},
     )
-    st.plotly_chart(fig2, use_container_width=True)
+    return fig
 
 
-def render_storage_treemap(partition_df: pd.DataFrame) -> None:
-    """Render a Plotly treemap of storage by database > table > partition.
+def render_throughput_charts(
+    throughput_df: pd.DataFrame,
+    selected_mv: Optional[str] = None,
+    slot: Optional[DeltaGenerator] = None,
+) -> None:
+    """Render throughput charts using Plotly area charts.
 
     Args:
-        partition_df: DataFrame with partition storage data
+        throughput_df: DataFrame with throughput data
+        selected_mv: Optional MV name to filter to
+        slot: Optional ``st.empty()`` placeholder to render into, so reruns
+            replace the charts in place instead of appending new elements
     """
-    if partition_df is None or partition_df.empty:
-        st.info("No partition storage data available.")
+    with slot.container() if slot is not None else contextlib.nullcontext():
+        _render_throughput_body(throughput_df, selected_mv)
+
+
+def _render_throughput_body(
+    throughput_df: pd.DataFrame, selected_mv: Optional[str]
+) -> None:
+    """Emit the throughput charts into the current Streamlit container."""
+    if throughput_df is None or throughput_df.empty:
+        st.info("No throughput data available for charts.")
         return
 
-    df = partition_df.copy()
-    df = df[df["bytes_on_disk"] > 0]
+    df = throughput_df
+    if selected_mv and selected_mv != "All":
+        df = _filter_view(df, selected_mv)
+
     if df.empty:
-        st.info("No storage data to display.")
+        st.info(f"No data for {selected_mv}.")
         return
 
+    time_col = "interval_start" if "interval_start" in df.columns else "hour"
+    if time_col not in df.columns:
+        st.info("No time series data available.")
+        return
+
+    rows_fig, duration_fig = _throughput_figures(df, time_col)
+
+    # Rows written/read area chart
+    st.markdown(
+        '<div class="lenses-card-title">Rows per 5-Minute Interval</div>',
+        unsafe_allow_html=True,
+    )
+    st.plotly_chart(rows_fig, use_container_width=True)
+
+    # Duration chart
+    st.markdown(
+        '<div class="lenses-card-title">Average Duration (ms)</div>',
+        unsafe_allow_html=True,
+    )
+    st.plotly_chart(duration_fig, use_container_width=True, config=_NO_MODEBAR_CONFIG)
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _throughput_figures(df: pd.DataFrame, time_col: str) -> tuple[go.Figure, go.Figure]:
+    """Aggregate per time bucket and fill the rows and duration figures.
+
+    Cached on the (filtered) data, so reruns that leave it unchanged skip the
+    aggregation and the template copies.
+    """
+    chart_data = _aggregate_by_time(df, time_col)
+
+    rows_fig = copy.deepcopy(_rows_figure_template())
+    rows_fig.data[0].x = chart_data[time_col]
+    rows_fig.data[0].y = chart_data["rows_written"]
+    rows_fig.data[1].x = chart_data[time_col]
+    rows_fig.data[1].y = chart_data["rows_read"]
+
+    duration_fig = copy.deepcopy(_duration_figure_template())
+    duration_fig.data[0].x = chart_data[time_col]
+    duration_fig.data[0].y = chart_data["avg_duration_ms"]
+    return rows_fig, duration_fig
+
+
+def _collapse_tail_partitions(df: pd.DataFrame, top_k: int) -> pd.DataFrame:
+    """Keep the top-K partitions per table and fold the rest into "(others)"."""
+    # observed=True: database/table may be categorical; skip empty combinations.
+    # sort=False: the treemap orders tiles by value, so group order is irrelevant
+    rank = df.groupby(["database", "table"], sort=False, observed=True)[
+        "bytes_on_disk"
+    ].rank(method="first", ascending=False)
+    if (rank <= top_k).all():
+        return df
+
+    tail = (
+        df[rank > top_k]
+        .groupby(["database", "table"], as_index=False, sort=False, observed=True)
+        .agg(
+            rows=("rows", "sum"),
+            bytes_on_disk=("bytes_on_disk", "sum"),
+            compressed_bytes=("compressed_bytes", "sum"),
+        )
+        .assign(partition="(others)")
+    )
+    return pd.concat([df[rank <= top_k], tail], ignore_index=True)
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _treemap_figure(partition_df: pd.DataFrame) -> Optional[go.Figure]:
+    """Build the storage treemap, or None when no partition has data on disk.
+
+    Cached on the partition data, so reruns that leave it unchanged skip the
+    tail collapse and the Plotly hierarchy build.
+    """
+    df = partition_df[partition_df["bytes_on_disk"] > 0]
+    if df.empty:
+        return None
+
+    df = _collapse_tail_partitions(df, _TREEMAP_TOP_PARTITIONS)
+
+    # Pre-format hover values so the figure JSON carries plain strings
+    df = df.assign(
+        rows_fmt=format_number_array(df["rows"]),
+        compressed_fmt=format_bytes_array(df["compressed_bytes"]),
+    )
+
     fig = px.treemap(
         df,
         path=["database", "table", "partition"],
         values="bytes_on_disk",
         color="bytes_on_disk",
         color_continuous_scale=_F0_TREEMAP_SCALE,
-        hover_data={"rows": ":,", "compressed_bytes": ":,"},
+        custom_data=["rows_fmt", "compressed_fmt"],
     )
     fig.update_layout(
         margin={"t": 30, "b": 10, "l": 10, "r": 10},
@@ -161,7 +283,30 @@ def render_storage_treemap(partition_df: pd.DataFrame) -> None:
     fig.update_traces(
         textinfo="label+value",
         texttemplate="%{label}<br>%{value:,.0f} B",
+        hovertemplate=(
+            "%{label}<br>%{value:,.0f} B on disk"
+            "<br>%{customdata[0]} rows"
+            "<br>%{customdata[1]} compressed<extra></extra>"
+        ),
     )
+    return fig
+
+
+def render_storage_treemap(partition_df: pd.DataFrame) -> None:
+    """Render a Plotly treemap of storage by database > table > partition.
+
+    Args:
+        partition_df: DataFrame with partition storage data
+    """
+    if partition_df is None or partition_df.empty:
+        st.info("No partition storage data available.")
+        return
+
+    fig = _treemap_figure(partition_df)
+    if fig is None:
+        st.info("No storage data to display.")
+        return
+
     st.plotly_chart(fig, use_container_width=True)
 
 
@@ -192,4 +337,4 @@ def render_engine_pie_chart(schema_df: pd.DataFrame) -> None:
         height=300,
     )
     fig.update_traces(textinfo="label+percent", textfont_size=11)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=_STATIC_CONFIG)
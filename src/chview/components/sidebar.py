@@ -2,9 +2,39 @@
 
 from typing import Optional
 
+import numpy as np
 import streamlit as st
 
-from chview.core.formatters import format_number
+from chview.core.formatters import format_number_array
+
+# Static sidebar markup; only version and host are substituted per run
+_DATABASE_LABEL_HTML = """
+    <div style="margin: 0.5rem 0 0.5rem 0;">
+        <div style="font-size: 0.75rem; font-weight: 600; color: #A4ABBA; margin-bottom: 0.3rem;">
+            DATABASE
+        </div>
+    </div>
+    """
+
+_LOGO_HTML = """
+    <div style="text-align: center; padding: 1.5rem 0 0.75rem 0;">
+        <div style="font-size: 2rem; font-family: 'Inter', sans-serif; letter-spacing: 0.5px;">
+            <span style="font-weight: 700; color: var(--accent);">ch</span><span style="font-weight: 400; color: var(--fg-default);">view</span>
+        </div>
+    </div>
+    """
+
+_CONNECTED_TPL = (
+    '<div style="text-align: center; font-size: 0.85rem; color: #10B77A;">'
+    '<span style="font-size: 0.6rem;">&#9679;</span> Connected · v{version}</div>'
+)
+_DISCONNECTED_HTML = (
+    '<div style="text-align: center; font-size: 0.85rem; color: #FF5C4D;">'
+    '<span style="font-size: 0.6rem;">&#9679;</span> Disconnected</div>'
+)
+_HOST_TPL = (
+    '<div style="text-align: center; font-size: 0.85rem; opacity: 0.6;">{host}</div>'
+)
 
 
 def render_database_selector(databases: list[str], selected_db: str = "All") -> str:
@@ -19,16 +49,7 @@ def render_database_selector(databases: list[str], selected_db: str = "All") ->
     """
     options = ["All"] + databases
 
-    st.sidebar.markdown(
-        """
-    <div style="margin: 0.5rem 0 0.5rem 0;">
-        <div style="font-size: 0.75rem; font-weight: 600; color: #A4ABBA; margin-bottom: 0.3rem;">
-            DATABASE
-        </div>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
+    st.sidebar.markdown(_DATABASE_LABEL_HTML, unsafe_allow_html=True)
 
     selected = st.sidebar.selectbox(
         "Select database",
@@ -53,40 +74,14 @@ def render_sidebar_nav(
     Returns:
         Currently selected database name
     """
-    # Logo
+    # Logo and connection status, sent as a single markdown element
+    status_html = (
+        _CONNECTED_TPL.format(version=version) if connected else _DISCONNECTED_HTML
+    )
     st.sidebar.markdown(
-        """
-    <div style="text-align: center; padding: 1.5rem 0 0.75rem 0;">
-        <div style="font-size: 2rem; font-family: 'Inter', sans-serif; letter-spacing: 0.5px;">
-            <span style="font-weight: 700; color: var(--accent);">ch</span><span style="font-weight: 400; color: var(--fg-default);">view</span>
-        </div>
-    </div>
-    """,
-        unsafe_allow_html=True,
+        _LOGO_HTML + status_html + _HOST_TPL.format(host=host), unsafe_allow_html=True
     )
 
-    # Connection status block
-    if connected:
-        st.sidebar.markdown(
-            f'<div style="text-align: center; font-size: 0.85rem; color: #10B77A;">'
-            f'<span style="font-size: 0.6rem;">&#9679;</span> Connected · v{version}</div>',
-            unsafe_allow_html=True,
-        )
-        st.sidebar.markdown(
-            f'<div style="text-align: center; font-size: 0.85rem; opacity: 0.6;">{host}</div>',
-            unsafe_allow_html=True,
-        )
-    else:
-        st.sidebar.markdown(
-            '<div style="text-align: center; font-size: 0.85rem; color: #FF5C4D;">'
-            '<span style="font-size: 0.6rem;">&#9679;</span> Disconnected</div>',
-            unsafe_allow_html=True,
-        )
-        st.sidebar.markdown(
-            f'<div style="text-align: center; font-size: 0.85rem; opacity: 0.6;">{host}</div>',
-            unsafe_allow_html=True,
-        )
-
     # Database selector (only if connected and databases available)
     if connected and databases:
         st.sidebar.divider()
@@ -105,7 +100,6 @@ def render_sidebar_nav(
         type="secondary",
     ):
         st.cache_data.clear()
-        st.session_state.pop("connection_result", None)
         st.rerun()
 
     st.sidebar.divider()
@@ -131,13 +125,37 @@ def render_sidebar_nav(
     return selected_db
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _test_connection_cached() -> tuple[bool, str, str]:
+    """Run the connection check at most once a minute across reruns."""
+    from chview.db.client import ClickHouseClient
+
+    return ClickHouseClient.test_connection()
+
+
 def render_connection_status() -> tuple[bool, str, str]:
-    """Test connection and return (success, version, host). Cached in session_state."""
-    if "connection_result" not in st.session_state:
-        from chview.db.client import ClickHouseClient
+    """Test connection and return (success, version, host). Cached for 60s."""
+    return _test_connection_cached()
+
 
-        st.session_state["connection_result"] = ClickHouseClient.test_connection()
-    return st.session_state["connection_result"]  # type: ignore[return-value]
+# Table picked in the schema browser during the current run, if any
+_SCHEMA_PICK_KEY = "_schema_pick"
+
+
+def _on_schema_pick(key: str, db: str, label_to_name: dict[str, str]) -> None:
+    """Open the picked table once, then reset the browser's selectbox.
+
+    Runs only when the selection changes, so later reruns (e.g. a nav button
+    click) are not pulled back to the tables page by a sticky widget value.
+    """
+    choice = st.session_state.get(key)
+    if choice is None:
+        return
+    pick = (db, label_to_name[choice])
+    st.session_state["selected_table"] = pick
+    st.session_state[_SCHEMA_PICK_KEY] = pick
+    st.session_state["current_page"] = "tables"
+    st.session_state[key] = None
 
 
 def render_schema_sidebar(schema_df) -> Optional[tuple[str, str]]:
@@ -152,33 +170,44 @@ def render_schema_sidebar(schema_df) -> Optional[tuple[str, str]]:
 
     st.sidebar.caption("SCHEMA BROWSER")
 
-    databases = schema_df["database"].unique()
-
-    selected = None
-    for db in sorted(databases):
-        db_tables = schema_df[schema_df["database"] == db]
-        with st.sidebar.expander(f"{db} ({len(db_tables)})", expanded=False):
-            for _, row in db_tables.iterrows():
-                engine = row["engine"]
-                total_rows = row["total_rows"]
-                row_display = (
-                    format_number(total_rows) if total_rows is not None else "N/A"
-                )
-
-                # Icon by engine type
-                if engine == "MaterializedView":
-                    icon = "\u25c6"
-                elif "MergeTree" in engine:
-                    icon = "\u25a0"
-                else:
-                    icon = "\u25cb"
-
-                label = f"{icon}  {row['name']}  \u00b7  {row_display} rows"
+    # Row positions per database, sorted by name, from one grouping pass
+    db_positions = schema_df.groupby("database", sort=True, observed=True).indices
 
-                if st.button(
-                    label, key=f"table_{db}_{row['name']}", use_container_width=True
-                ):
-                    selected = (db, row["name"])
-                    st.session_state["current_page"] = "tables"
+    # Format every row count in one vectorized pass, then slice per database
+    total_rows = schema_df["total_rows"]
+    row_displays = np.where(
+        total_rows.isna().to_numpy(), "N/A", format_number_array(total_rows)
+    )
 
-    return selected
+    # Icon by engine type, also computed once for the whole schema
+    engines = schema_df["engine"].to_numpy().astype(str)
+    icons = np.select(
+        [engines == "MaterializedView", np.char.find(engines, "MergeTree") >= 0],
+        ["\u25c6", "\u25a0"],
+        default="\u25cb",
+    )
+    names = schema_df["name"].to_numpy()
+
+    for db, positions in db_positions.items():
+        with st.sidebar.expander(f"{db} ({len(positions)})", expanded=False):
+            # One selectbox per database instead of one button per table
+            label_to_name: dict[str, str] = {
+                f"{icon}  {name}  \u00b7  {row_display} rows": name
+                for name, icon, row_display in zip(
+                    names[positions], icons[positions], row_displays[positions]
+                )
+            }
+
+            key = f"tables_{db}"
+            st.selectbox(
+                f"Tables in {db}",
+                options=list(label_to_name),
+                index=None,
+                key=key,
+                placeholder="Select a table",
+                label_visibility="collapsed",
+                on_change=_on_schema_pick,
+                args=(key, db, label_to_name),
+            )
+
+    return st.session_state.pop(_SCHEMA_PICK_KEY, None)
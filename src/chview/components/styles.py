@@ -2,11 +2,26 @@
 
 import streamlit as st
 
-
-def inject_custom_css() -> None:
-    """Inject global custom CSS for a clean, theme-respecting UI."""
-    st.markdown(
-        """
+_FONTS_URL = (
+    "https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700"
+    "&family=JetBrains+Mono:wght@400;500&display=swap"
+)
+
+# Font loading via <link> tags: unlike a CSS @import these don't block
+# stylesheet parsing, and the preconnect warms the font host early.
+_FONT_LINKS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    f'<link rel="preload" as="style" href="{_FONTS_URL}">'
+    f'<link rel="stylesheet" href="{_FONTS_URL}">'
+)
+
+
+# Static page stylesheet, emitted on every run because Streamlit drops
+# elements a rerun does not re-emit. Kept apart from _FONT_LINKS: the body
+# must open with <style> so markdown treats it as one raw HTML block up to
+# </style>, whereas a leading <link> block would end at the first blank line.
+_CSS_HTML = """
     <style>
     /* --- F0 Design System Tokens --- */
     :root {
@@ -75,9 +90,7 @@ def inject_custom_css() -> None:
         --f0-radius-xl: 16px;
     }
 
-    /* --- Fonts --- */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&family=JetBrains+Mono:wght@400;500&display=swap');
-
+    /* --- Fonts (loaded via _FONT_LINKS) --- */
     html, body, [class*="css"] {
         font-family: 'Inter', sans-serif;
     }
@@ -205,6 +218,10 @@ def inject_custom_css() -> None:
         min-height: 400px;
     }
     </style>
-    """,
-        unsafe_allow_html=True,
-    )
+    """
+
+
+def inject_custom_css() -> None:
+    """Inject global custom CSS for a clean, theme-respecting UI."""
+    st.markdown(_FONT_LINKS, unsafe_allow_html=True)
+    st.markdown(_CSS_HTML, unsafe_allow_html=True)
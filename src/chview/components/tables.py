@@ -1,33 +1,57 @@
 """DataFrame table rendering components."""
 
-from typing import Optional
+from typing import Any, Optional
 
 import pandas as pd
 import streamlit as st
 
-from chview.core.formatters import format_bytes, format_number
+from chview.core.formatters import (
+    format_bytes,
+    format_bytes_array,
+    format_number,
+    format_number_array,
+)
+from chview.core.models import ThroughputTotals
 
 
-def render_metrics_cards(throughput_df: pd.DataFrame) -> None:
-    """Render summary metric cards from throughput data.
+def _storage_row(storage_df: Optional[pd.DataFrame]) -> Optional[dict[str, Any]]:
+    """Return the row of a single-table storage frame, or None if it is empty."""
+    if storage_df is None or storage_df.empty:
+        return None
+    row: dict[str, Any] = storage_df.iloc[0].to_dict()
+    return row
+
+
+def _compression_ratio(row: dict[str, Any]) -> Optional[float]:
+    """Return the row's precomputed compression ratio, or None if absent/NaN."""
+    ratio = row.get("compression_ratio")
+    if ratio is None or ratio != ratio:  # ratio != ratio only for NaN
+        return None
+    return float(ratio)
+
+
+def render_metrics_cards(totals: Optional[ThroughputTotals]) -> None:
+    """Render summary metric cards from throughput totals.
 
     Args:
-        throughput_df: DataFrame with throughput metrics
+        totals: Executions, rows written and per-execution average duration
     """
-    if throughput_df is None or throughput_df.empty:
+    if not totals or not totals.get("executions"):
         st.info("No throughput data available.")
         return
 
     col1, col2, col3 = st.columns(3)
     with col1:
-        total_exec = throughput_df["executions"].sum()
-        st.metric("Total Executions", format_number(total_exec))
+        st.metric("Total Executions", format_number(totals["executions"]))
     with col2:
-        total_written = throughput_df["rows_written"].sum()
-        st.metric("Total Rows Written", format_number(total_written))
+        st.metric("Total Rows Written", format_number(totals["rows_written"]))
     with col3:
-        avg_dur = throughput_df["avg_duration_ms"].mean()
-        st.metric("Avg Duration", f"{avg_dur:.1f} ms" if pd.notna(avg_dur) else "N/A")
+        avg_dur = totals["avg_duration_ms"]
+        st.metric(
+            "Avg Duration",
+            f"{avg_dur:.1f} ms" if pd.notna(avg_dur) else "N/A",
+            help="Mean view duration per execution",
+        )
 
 
 def render_table_detail(
@@ -42,20 +66,15 @@ def render_table_detail(
     """
     st.subheader(f"`{database}`.`{table}`")
 
-    if storage_df is None or storage_df.empty:
+    if storage_df is None:
         st.info("No storage metrics available for this table.")
         return
 
-    table_data = storage_df[
-        (storage_df["database"] == database) & (storage_df["table"] == table)
-    ]
-
-    if table_data.empty:
+    row = _storage_row(storage_df)
+    if row is None:
         st.info("No active parts found for this table.")
         return
 
-    row = table_data.iloc[0]
-
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Rows", format_number(row.get("rows")))
@@ -66,12 +85,9 @@ def render_table_detail(
     with col4:
         st.metric("Uncompressed", format_bytes(row.get("uncompressed_bytes")))
 
-    if row.get("uncompressed_bytes") and row.get("compressed_bytes"):
-        uncomp = float(row["uncompressed_bytes"])
-        comp = float(row["compressed_bytes"])
-        if comp > 0:
-            ratio = uncomp / comp
-            st.caption(f"Compression ratio: {ratio:.1f}x")
+    ratio = _compression_ratio(row)
+    if ratio is not None:
+        st.caption(f"Compression ratio: {ratio:.1f}x")
 
 
 def render_node_detail(
@@ -93,20 +109,13 @@ def render_node_detail(
     with col_left:
         st.markdown(f"**`{database}`.`{table}`**")
 
-        if storage_df is not None and not storage_df.empty:
-            table_data = storage_df[
-                (storage_df["database"] == database) & (storage_df["table"] == table)
-            ]
-            if not table_data.empty:
-                row = table_data.iloc[0]
-                st.metric("Rows", format_number(row.get("rows")))
-                st.metric("Disk", format_bytes(row.get("bytes_on_disk")))
-                comp = row.get("compressed_bytes", 0)
-                uncomp = row.get("uncompressed_bytes", 0)
-                if comp and uncomp and float(comp) > 0:
-                    st.metric("Compression", f"{float(uncomp) / float(comp):.1f}x")
-            else:
-                st.caption("No storage data available.")
+        row = _storage_row(storage_df)
+        if row is not None:
+            st.metric("Rows", format_number(row.get("rows")))
+            st.metric("Disk", format_bytes(row.get("bytes_on_disk")))
+            ratio = _compression_ratio(row)
+            if ratio is not None:
+                st.metric("Compression", f"{ratio:.1f}x")
         else:
             st.caption("No storage data available.")
 
@@ -132,27 +141,18 @@ def render_node_detail_sidebar(
         ddl_type: Type of DDL - "TABLE" or "VIEW"
     """
     # Storage metrics
-    if storage_df is not None and not storage_df.empty:
-        table_data = storage_df[
-            (storage_df["database"] == database) & (storage_df["table"] == table)
-        ]
-        if not table_data.empty:
-            row = table_data.iloc[0]
-
-            st.markdown("**Storage**")
-            c1, c2 = st.columns(2)
-            with c1:
-                st.metric("Rows", format_number(row.get("rows")))
-            with c2:
-                st.metric("Disk", format_bytes(row.get("bytes_on_disk")))
-
-            comp = row.get("compressed_bytes", 0)
-            uncomp = row.get("uncompressed_bytes", 0)
-            if comp and uncomp and float(comp) > 0:
-                ratio = float(uncomp) / float(comp)
-                st.metric("Compression", f"{ratio:.1f}x")
-        else:
-            st.caption("No storage data")
+    row = _storage_row(storage_df)
+    if row is not None:
+        st.markdown("**Storage**")
+        c1, c2 = st.columns(2)
+        with c1:
+            st.metric("Rows", format_number(row.get("rows")))
+        with c2:
+            st.metric("Disk", format_bytes(row.get("bytes_on_disk")))
+
+        ratio = _compression_ratio(row)
+        if ratio is not None:
+            st.metric("Compression", f"{ratio:.1f}x")
     else:
         st.caption("No storage data")
 
@@ -164,6 +164,22 @@ def render_node_detail_sidebar(
         st.code(create_sql, language="sql")
 
 
+@st.cache_data(max_entries=4, show_spinner=False)
+def _schema_display_frame(schema_df: pd.DataFrame) -> pd.DataFrame:
+    """Select, format and rename the schema columns shown in table listings.
+
+    Cached on the schema contents, so the overview and tables pages share one
+    formatting pass for the same schema.
+    """
+    display_df = schema_df[
+        ["database", "name", "engine", "total_rows", "total_bytes"]
+    ].copy()
+    display_df["total_rows"] = format_number_array(display_df["total_rows"])
+    display_df["total_bytes"] = format_bytes_array(display_df["total_bytes"])
+    display_df.columns = ["Database", "Name", "Engine", "Rows", "Size"]
+    return display_df
+
+
 def render_schema_table(schema_df: pd.DataFrame) -> None:
     """Render the full schema table with formatted rows and sizes.
 
@@ -174,10 +190,6 @@ def render_schema_table(schema_df: pd.DataFrame) -> None:
         st.info("No tables found.")
         return
 
-    display_df = schema_df[
-        ["database", "name", "engine", "total_rows", "total_bytes"]
-    ].copy()
-    display_df["total_rows"] = display_df["total_rows"].apply(format_number)
-    display_df["total_bytes"] = display_df["total_bytes"].apply(format_bytes)
-    display_df.columns = ["Database", "Name", "Engine", "Rows", "Size"]
-    st.dataframe(display_df, use_container_width=True, hide_index=True)
+    st.dataframe(
+        _schema_display_frame(schema_df), use_container_width=True, hide_index=True
+    )
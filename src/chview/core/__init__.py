@@ -2,8 +2,10 @@
 
 from chview.core.formatters import (
     format_bytes,
+    format_bytes_array,
     format_duration_ms,
     format_number,
+    format_number_array,
     format_timestamp_ago,
 )
 from chview.core.models import (
@@ -19,12 +21,15 @@ from chview.core.models import (
     StorageMetrics,
     TableInfo,
     ThroughputMetrics,
+    ThroughputTotals,
 )
 
 __all__ = [
     "format_bytes",
+    "format_bytes_array",
     "format_duration_ms",
     "format_number",
+    "format_number_array",
     "format_timestamp_ago",
     "ClusterInfo",
     "ConnectionInfo",
@@ -38,4 +43,5 @@ __all__ = [
     "StorageMetrics",
     "TableInfo",
     "ThroughputMetrics",
+    "ThroughputTotals",
 ]
@@ -1,7 +1,10 @@
 """Data formatting utilities."""
 
-import math
-from typing import Optional, Union
+import functools
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
 
 
 def format_number(n: Optional[Union[int, float]]) -> str:
@@ -13,10 +16,17 @@ def format_number(n: Optional[Union[int, float]]) -> str:
     Returns:
         Formatted string like "1.2K", "3.4M", etc.
     """
-    if n is None or (isinstance(n, float) and math.isnan(n)):
+    if type(n) is int and -1_000 < n < 1_000:  # common small-count fast path
+        return str(n)
+    if n is None or n != n:  # n != n only for NaN
         return "—"
 
-    n = float(n)
+    return _format_number_cached(float(n))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_number_cached(n: float) -> str:
+    """Format a non-null number; cached since column values repeat heavily."""
     if abs(n) < 1_000:
         return f"{n:,.0f}"
 
@@ -37,10 +47,17 @@ def format_bytes(n: Optional[Union[int, float]]) -> str:
     Returns:
         Formatted string like "1.5 GB", "256 MB", etc.
     """
-    if n is None or (isinstance(n, float) and math.isnan(n)):
+    if type(n) is int and -1024 < n < 1024:  # sub-KB sizes skip float coercion
+        return f"{n}.0 B"
+    if n is None or n != n:  # n != n only for NaN
         return "—"
 
-    n = float(n)
+    return _format_bytes_cached(float(n))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_bytes_cached(n: float) -> str:
+    """Format a non-null byte count; cached since column values repeat heavily."""
     for unit in ["B", "KB", "MB", "GB", "TB"]:
         if abs(n) < 1024:
             return f"{n:.1f} {unit}"
@@ -49,6 +66,68 @@ def format_bytes(n: Optional[Union[int, float]]) -> str:
     return f"{n:.1f} PB"
 
 
+def _to_float_array(values: Any) -> np.ndarray:
+    """Coerce a column-like of numbers/None to a float64 array (None → NaN)."""
+    return np.asarray(pd.to_numeric(pd.Series(values), errors="coerce"), dtype=float)
+
+
+def format_number_array(values: Any) -> np.ndarray:
+    """Vectorized :func:`format_number` over an array-like column.
+
+    Unit scaling and NaN handling run as NumPy array ops; only the final
+    ``%``-formatting touches each element. Output matches the scalar version.
+
+    Args:
+        values: Array-like of numbers (None/NaN allowed)
+
+    Returns:
+        Object array of formatted strings
+    """
+    arr = _to_float_array(values)
+    scaled = arr.copy()
+    divisions = np.zeros(arr.shape, dtype=np.intp)
+    for _ in range(5):
+        big = np.abs(scaled) >= 1_000
+        scaled = np.where(big, scaled / 1_000, scaled)
+        divisions += big
+
+    units = np.array(["", "K", "M", "B", "T", "P"])
+    out = np.where(
+        divisions == 0,
+        np.char.mod("%.0f", scaled),
+        np.char.add(np.char.mod("%.1f", scaled), units[divisions]),
+    ).astype(object)
+
+    # Values that need a thousands separator once rounded (rare) use the scalar path
+    for i in np.flatnonzero((np.abs(scaled) >= 999.5) | (divisions == 5)):
+        out[i] = format_number(arr[i])
+    out[np.isnan(arr)] = "—"
+    return out
+
+
+def format_bytes_array(values: Any) -> np.ndarray:
+    """Vectorized :func:`format_bytes` over an array-like column.
+
+    Args:
+        values: Array-like of byte counts (None/NaN allowed)
+
+    Returns:
+        Object array of formatted strings
+    """
+    arr = _to_float_array(values)
+    scaled = arr.copy()
+    divisions = np.zeros(arr.shape, dtype=np.intp)
+    for _ in range(5):
+        big = np.abs(scaled) >= 1024
+        scaled = np.where(big, scaled / 1024, scaled)
+        divisions += big
+
+    units = np.array([" B", " KB", " MB", " GB", " TB", " PB"])
+    out = np.char.add(np.char.mod("%.1f", scaled), units[divisions]).astype(object)
+    out[np.isnan(arr)] = "—"
+    return out
+
+
 def format_duration_ms(ms: Optional[float]) -> str:
     """Format duration in milliseconds.
 
@@ -1,10 +1,14 @@
 """Core data models for CHView."""
 
+import sys
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional, TypedDict
 
+# slots=True drops the per-instance __dict__; only available on Python 3.10+
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class TableInfo:
     """Information about a database table."""
 
@@ -20,7 +24,7 @@ class TableInfo:
         return f"{self.database}.{self.name}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ClusterInfo:
     """ClickHouse cluster overview information."""
 
@@ -40,7 +44,7 @@ class ClusterInfo:
         return f"{hours:.1f} hrs"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StorageMetrics:
     """Storage metrics for a table."""
 
@@ -64,7 +68,7 @@ class StorageMetrics:
         return None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PartitionMetrics:
     """Storage metrics for a partition."""
 
@@ -76,7 +80,7 @@ class PartitionMetrics:
     compressed_bytes: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MaterializedViewInfo:
     """Information about a materialized view."""
 
@@ -92,7 +96,7 @@ class MaterializedViewInfo:
         return f"{self.database}.{self.name}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ThroughputMetrics:
     """Materialized view throughput metrics."""
 
@@ -105,7 +109,19 @@ class ThroughputMetrics:
     avg_duration_ms: float
 
 
-@dataclass
+class ThroughputTotals(TypedDict):
+    """Materialized view throughput totals over a time window.
+
+    ``avg_duration_ms`` is the mean duration per execution, not the mean of
+    the per-interval averages.
+    """
+
+    executions: int
+    rows_written: int
+    avg_duration_ms: float
+
+
+@dataclass(**_SLOTS)
 class MVError:
     """Materialized view error entry."""
 
@@ -116,7 +132,7 @@ class MVError:
     error_count: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class KafkaConsumerInfo:
     """Kafka consumer health information."""
 
@@ -149,7 +165,7 @@ class KafkaConsumerInfo:
         return "healthy"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConnectionInfo:
     """ClickHouse connection information."""
 
@@ -161,7 +177,7 @@ class ConnectionInfo:
     secure: bool
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LineageNode:
     """Node in the lineage graph."""
 
@@ -175,7 +191,7 @@ class LineageNode:
             self.full_name = f"{self.database}.{self.name}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LineageEdge:
     """Edge in the lineage graph."""
 
@@ -184,7 +200,7 @@ class LineageEdge:
     mv_name: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LineageGraph:
     """Complete lineage graph."""
 
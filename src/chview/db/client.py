@@ -1,13 +1,57 @@
 """ClickHouse database client and connection management."""
 
 import os
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
 
 import clickhouse_connect
+from clickhouse_connect.driver import httputil
 from clickhouse_connect.driver.client import Client
+from urllib3 import PoolManager
 
 from chview.core.models import ConnectionInfo
 
+# HTTP pool sizing: the shared default pool keeps 8 connections per host, so
+# concurrent dashboard queries beyond that open and discard extra connections
+_POOL_NUM_POOLS = 16
+_POOL_MAXSIZE = 32
+
+# Shared clients keyed on connection params, least recently used first
+_ClientKey = tuple[tuple[str, Any], ...]
+_CLIENTS: OrderedDict[_ClientKey, tuple[Client, PoolManager]] = OrderedDict()
+_CLIENTS_MAX_ENTRIES = 4
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _shared_client(params: _ClientKey) -> Client:
+    """Return a ClickHouse client, reused for identical connection params.
+
+    Session IDs are disabled so the shared client can serve concurrent
+    Streamlit sessions (ClickHouse rejects concurrent queries in one session),
+    and the client gets its own pool manager sized for that concurrency.
+    Evicted clients are closed and their pools cleared; ``close()`` alone
+    leaves a passed-in pool manager's connections open.
+    """
+    with _CLIENTS_LOCK:
+        cached = _CLIENTS.get(params)
+        if cached is not None:
+            _CLIENTS.move_to_end(params)
+            return cached[0]
+
+        pool_mgr = httputil.get_pool_manager(
+            num_pools=_POOL_NUM_POOLS, maxsize=_POOL_MAXSIZE, block=True
+        )
+        client = clickhouse_connect.get_client(
+            **dict(params), pool_mgr=pool_mgr, autogenerate_session_id=False
+        )
+        if len(_CLIENTS) >= _CLIENTS_MAX_ENTRIES:
+            _, (old_client, old_pool_mgr) = _CLIENTS.popitem(last=False)
+            old_client.close()
+            old_pool_mgr.clear()
+        _CLIENTS[params] = (client, pool_mgr)
+        return client
+
 
 class ClickHouseClient:
     """Manages ClickHouse database connections."""
@@ -39,9 +83,9 @@ class ClickHouseClient:
 
     @classmethod
     def get_client(cls) -> Client:
-        """Create a new ClickHouse client instance."""
+        """Return the shared ClickHouse client for the configured connection."""
         params = cls._get_connection_params()
-        return clickhouse_connect.get_client(**params)
+        return _shared_client(tuple(sorted(params.items())))
 
     @classmethod
     def test_connection(cls) -> tuple[bool, str, str]:
@@ -1,13 +1,35 @@
 """SQL query builder with DRY pattern for database filtering."""
 
-from typing import Optional
+import functools
+from typing import Any, Callable, Optional
 
+from clickhouse_connect.driver.binding import quote_identifier
 
+QueryBuilder = Callable[..., tuple[str, dict[str, Any]]]
+
+
+def _memoized(builder: QueryBuilder) -> QueryBuilder:
+    """Memoize a query builder on its (small, hashable) arguments.
+
+    Each call gets its own copy of the params dict so callers can't mutate
+    the cached entry.
+    """
+    cached = functools.lru_cache(maxsize=128)(builder)
+
+    @functools.wraps(builder)
+    def wrapper(*args: object, **kwargs: object) -> tuple[str, dict[str, Any]]:
+        query, params = cached(*args, **kwargs)
+        return query, dict(params)
+
+    return wrapper
+
+
+@_memoized
 def build_database_filter(
     column: str = "database",
     database: Optional[str] = None,
     exclude_system: bool = True,
-) -> tuple[str, dict]:
+) -> tuple[str, dict[str, Any]]:
     """Build WHERE clause with optional database filter.
 
     Args:
@@ -19,7 +41,7 @@ def build_database_filter(
         Tuple of (where_clause, parameters)
     """
     conditions = []
-    params = {}
+    params: dict[str, Any] = {}
 
     if database and database != "All":
         conditions.append(f"{column} = %(database)s")
@@ -34,7 +56,10 @@ def build_database_filter(
     return "", {}
 
 
-def build_system_tables_query(database: Optional[str] = None) -> tuple[str, dict]:
+@_memoized
+def build_system_tables_query(
+    database: Optional[str] = None,
+) -> tuple[str, dict[str, Any]]:
     """Build query for fetching table schema information."""
     where_clause, params = build_database_filter(
         "database", database, exclude_system=True
@@ -54,7 +79,10 @@ def build_system_tables_query(database: Optional[str] = None) -> tuple[str, dict
     return query, params
 
 
-def build_materialized_views_query(database: Optional[str] = None) -> tuple[str, dict]:
+@_memoized
+def build_materialized_views_query(
+    database: Optional[str] = None,
+) -> tuple[str, dict[str, Any]]:
     """Build query for fetching materialized views."""
     where_clause, params = build_database_filter(
         "database", database, exclude_system=False
@@ -79,18 +107,10 @@ def build_materialized_views_query(database: Optional[str] = None) -> tuple[str,
     return query, params
 
 
-def build_storage_metrics_query(database: Optional[str] = None) -> tuple[str, dict]:
-    """Build query for fetching storage metrics."""
-    where_clause, params = build_database_filter(
-        "database", database, exclude_system=True
-    )
-
-    if where_clause:
-        where_clause += " AND active = 1"
-    else:
-        where_clause = "WHERE active = 1"
-
-    query = f"""
+@_memoized
+def build_storage_detail_query(database: str, table: str) -> tuple[str, dict[str, Any]]:
+    """Build query for fetching full storage metrics of a single table."""
+    query = """
         SELECT
             database,
             table,
@@ -99,15 +119,19 @@ def build_storage_metrics_query(database: Optional[str] = None) -> tuple[str, di
             sum(data_compressed_bytes) AS compressed_bytes,
             sum(data_uncompressed_bytes) AS uncompressed_bytes
         FROM system.parts
-        {where_clause}
+        WHERE active = 1
+          AND database = %(database)s
+          AND table = %(table)s
         GROUP BY database, table
-        ORDER BY database, table
         SETTINGS max_execution_time = 120
     """
-    return query, params
+    return query, {"database": database, "table": table}
 
 
-def build_partition_storage_query(database: Optional[str] = None) -> tuple[str, dict]:
+@_memoized
+def build_partition_storage_query(
+    database: Optional[str] = None,
+) -> tuple[str, dict[str, Any]]:
     """Build query for fetching partition-level storage metrics."""
     where_clause, params = build_database_filter(
         "database", database, exclude_system=True
@@ -129,6 +153,7 @@ def build_partition_storage_query(database: Optional[str] = None) -> tuple[str,
         FROM system.parts
         {where_clause}
         GROUP BY database, table, partition
+        HAVING bytes_on_disk > 0
         ORDER BY bytes_on_disk DESC
         LIMIT 5000
         SETTINGS max_execution_time = 120
@@ -136,50 +161,77 @@ def build_partition_storage_query(database: Optional[str] = None) -> tuple[str,
     return query, params
 
 
-def build_cluster_info_query(database: Optional[str] = None) -> tuple[str, dict]:
+@_memoized
+def build_cluster_info_query(
+    database: Optional[str] = None,
+) -> tuple[str, dict[str, Any]]:
     """Build query for fetching cluster overview information."""
-    params = {}
+    params: dict[str, Any] = {}
 
+    # One scan each of system.tables and system.parts, cross-joined as 1-row CTEs
     if database and database != "All":
         query = """
-            SELECT
-                version(),
-                uptime(),
-                1,
-                (SELECT count() FROM system.tables WHERE database = %(database)s),
-                (SELECT count() FROM system.tables
-                 WHERE database = %(database)s AND engine = 'MaterializedView'),
-                (SELECT sum(bytes_on_disk) FROM system.parts
-                 WHERE active = 1 AND database = %(database)s)
+            WITH
+                t AS (
+                    SELECT
+                        count() AS table_count,
+                        countIf(engine = 'MaterializedView') AS mv_count
+                    FROM system.tables
+                    WHERE database = %(database)s
+                ),
+                p AS (
+                    SELECT sum(bytes_on_disk) AS disk_bytes
+                    FROM system.parts
+                    WHERE active = 1 AND database = %(database)s
+                )
+            SELECT version(), uptime(), 1, t.table_count, t.mv_count, p.disk_bytes
+            FROM t CROSS JOIN p
             SETTINGS max_execution_time = 120
         """
         params["database"] = database
     else:
         query = """
+            WITH
+                t AS (
+                    SELECT
+                        countIf(database NOT IN
+                            ('system', 'INFORMATION_SCHEMA', 'information_schema')
+                        ) AS table_count,
+                        countIf(engine = 'MaterializedView') AS mv_count
+                    FROM system.tables
+                ),
+                p AS (
+                    SELECT sum(bytes_on_disk) AS disk_bytes
+                    FROM system.parts
+                    WHERE active = 1
+                )
             SELECT
                 version(),
                 uptime(),
                 (SELECT count() FROM system.databases
                  WHERE name NOT IN ('system', 'INFORMATION_SCHEMA', 'information_schema')),
-                (SELECT count() FROM system.tables
-                 WHERE database NOT IN ('system', 'INFORMATION_SCHEMA', 'information_schema')),
-                (SELECT count() FROM system.tables WHERE engine = 'MaterializedView'),
-                (SELECT sum(bytes_on_disk) FROM system.parts WHERE active = 1)
+                t.table_count,
+                t.mv_count,
+                p.disk_bytes
+            FROM t CROSS JOIN p
             SETTINGS max_execution_time = 120
         """
 
     return query, params
 
 
+@_memoized
 def build_mv_throughput_query(
     hours: int = 24, database: Optional[str] = None
-) -> tuple[str, dict]:
+) -> tuple[str, dict[str, Any]]:
     """Build query for fetching MV throughput metrics."""
-    params = {"hours": hours}
+    params: dict[str, Any] = {"hours": hours}
 
     if database and database != "All":
-        db_filter = "AND view_name LIKE %(db_pattern)s"
-        params["db_pattern"] = f"{database}.%"
+        # Prefix compare instead of LIKE: no pattern matching, and "_" in a
+        # database name is not treated as a wildcard
+        db_filter = "AND startsWith(view_name, %(db_prefix)s)"
+        params["db_prefix"] = f"{database}."
     else:
         db_filter = ""
 
@@ -197,20 +249,46 @@ def build_mv_throughput_query(
           AND status = 'QueryFinish'
           {db_filter}
         GROUP BY view_name, interval_start
-        ORDER BY view_name, interval_start
     """
     return query, params
 
 
+@_memoized
+def build_throughput_totals_query(
+    hours: int = 24, database: Optional[str] = None
+) -> tuple[str, dict[str, Any]]:
+    """Build query for fetching aggregate MV throughput totals."""
+    params: dict[str, Any] = {"hours": hours}
+
+    if database and database != "All":
+        db_filter = "AND startsWith(view_name, %(db_prefix)s)"
+        params["db_prefix"] = f"{database}."
+    else:
+        db_filter = ""
+
+    query = f"""
+        SELECT
+            count() AS executions,
+            sum(written_rows) AS rows_written,
+            avg(view_duration_ms) AS avg_duration_ms
+        FROM system.query_views_log
+        WHERE event_time >= now() - INTERVAL %(hours)s HOUR
+          AND status = 'QueryFinish'
+          {db_filter}
+    """
+    return query, params
+
+
+@_memoized
 def build_recent_throughput_query(
     minutes: int = 30, database: Optional[str] = None
-) -> tuple[str, dict]:
+) -> tuple[str, dict[str, Any]]:
     """Build query for fetching recent throughput data."""
-    params = {"minutes": minutes}
+    params: dict[str, Any] = {"minutes": minutes}
 
     if database and database != "All":
-        db_filter = "AND view_name LIKE %(db_pattern)s"
-        params["db_pattern"] = f"{database}.%"
+        db_filter = "AND startsWith(view_name, %(db_prefix)s)"
+        params["db_prefix"] = f"{database}."
     else:
         db_filter = ""
 
@@ -224,20 +302,20 @@ def build_recent_throughput_query(
           AND status = 'QueryFinish'
           {db_filter}
         GROUP BY view_name, interval_start
-        ORDER BY view_name, interval_start
     """
     return query, params
 
 
+@_memoized
 def build_mv_errors_query(
     hours: int = 24, database: Optional[str] = None
-) -> tuple[str, dict]:
+) -> tuple[str, dict[str, Any]]:
     """Build query for fetching MV errors."""
-    params = {"hours": hours}
+    params: dict[str, Any] = {"hours": hours}
 
     if database and database != "All":
-        db_filter = "AND view_name LIKE %(db_pattern)s"
-        params["db_pattern"] = f"{database}.%"
+        db_filter = "AND startsWith(view_name, %(db_prefix)s)"
+        params["db_prefix"] = f"{database}."
     else:
         db_filter = ""
 
@@ -258,9 +336,12 @@ def build_mv_errors_query(
     return query, params
 
 
-def build_kafka_consumers_query(database: Optional[str] = None) -> tuple[str, dict]:
+@_memoized
+def build_kafka_consumers_query(
+    database: Optional[str] = None,
+) -> tuple[str, dict[str, Any]]:
     """Build query for fetching Kafka consumer health data."""
-    params = {}
+    params: dict[str, Any] = {}
 
     if database and database != "All":
         db_filter = "AND database = %(database)s"
@@ -268,31 +349,52 @@ def build_kafka_consumers_query(database: Optional[str] = None) -> tuple[str, di
     else:
         db_filter = ""
 
+    # Filter consumers first so only surviving rows are expanded per assignment
     query = f"""
         SELECT
             database,
             table,
             consumer_id,
-            assignments.topic AS topic,
-            assignments.partition_id AS partition_id,
-            assignments.current_offset AS current_offset,
+            topic,
+            partition_id,
+            current_offset,
             last_poll_time,
             num_messages_read,
-            num_rebalance_revocations + num_rebalance_assignments AS rebalance_count,
+            rebalance_count,
             is_currently_used,
             dateDiff('second', last_poll_time, now()) AS seconds_since_poll
-        FROM system.kafka_consumers
-        ARRAY JOIN assignments
-        WHERE 1=1 {db_filter}
+        FROM (
+            SELECT
+                database,
+                table,
+                consumer_id,
+                assignments.topic AS topics,
+                assignments.partition_id AS partition_ids,
+                assignments.current_offset AS current_offsets,
+                last_poll_time,
+                num_messages_read,
+                num_rebalance_revocations + num_rebalance_assignments
+                    AS rebalance_count,
+                is_currently_used
+            FROM system.kafka_consumers
+            WHERE 1=1 {db_filter}
+        )
+        ARRAY JOIN
+            topics AS topic,
+            partition_ids AS partition_id,
+            current_offsets AS current_offset
         ORDER BY database, table, consumer_id
         LIMIT 1000
     """
     return query, params
 
 
-def build_kafka_check_query(database: Optional[str] = None) -> tuple[str, dict]:
+@_memoized
+def build_kafka_check_query(
+    database: Optional[str] = None,
+) -> tuple[str, dict[str, Any]]:
     """Build query to check if any Kafka tables exist."""
-    params = {}
+    params: dict[str, Any] = {}
 
     if database and database != "All":
         query = """
@@ -310,3 +412,15 @@ def build_kafka_check_query(database: Optional[str] = None) -> tuple[str, dict]:
         """
 
     return query, params
+
+
+@_memoized
+def build_show_create_query(database: str, table: str) -> tuple[str, dict[str, Any]]:
+    """Build SHOW CREATE for a table or view with backtick-quoted identifiers.
+
+    Identifiers can't be bound as %(...)s parameters (those render as string
+    literals), so names are quoted and escaped inline. Already-quoted names,
+    such as implicit ``.inner.`` targets, are kept as-is.
+    """
+    query = f"SHOW CREATE TABLE {quote_identifier(database)}.{quote_identifier(table)}"
+    return query, {}
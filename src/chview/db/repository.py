@@ -1,22 +1,112 @@
 """High-level data repository for ClickHouse operations."""
 
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
 
+import numpy as np
 import pandas as pd
+from clickhouse_connect.driver.client import Client
 
+from chview.core.models import ThroughputTotals
 from chview.db import queries
 from chview.db.client import ClickHouseClient
 
+# Shared by concurrent fetches; clickhouse-connect releases the GIL on HTTP I/O
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="chview-fetch")
+
+
+@dataclass
+class DashboardBundle:
+    """Results of the overview dashboard's independent fetches.
+
+    A failed fetch leaves its field as None and records its error message in
+    ``errors`` (keyed by field name), so the page can degrade per section.
+    """
+
+    cluster_info: Optional[dict[str, Any]]
+    schema: Optional[pd.DataFrame]
+    mv_errors: Optional[pd.DataFrame]
+    errors: dict[str, str] = field(default_factory=dict)
+
+
+def fetch_dashboard_bundle(
+    load_cluster_info: Callable[..., dict[str, Any]],
+    load_schema: Callable[..., pd.DataFrame],
+    load_mv_errors: Callable[..., Optional[pd.DataFrame]],
+    database: Optional[str] = None,
+) -> DashboardBundle:
+    """Run the overview dashboard's loaders concurrently.
+
+    The queries are independent, so the page waits for the slowest one
+    rather than their sum. The loaders are passed in so each keeps its own
+    cache and TTL; a loader that raises is recorded in the bundle (and, not
+    being cached, retried on the next rerun) while the other sections are
+    still returned.
+    """
+    cluster_info = _FETCH_EXECUTOR.submit(load_cluster_info, database=database)
+    schema = _FETCH_EXECUTOR.submit(load_schema, database=database)
+    mv_errors = _FETCH_EXECUTOR.submit(load_mv_errors, hours=24, database=database)
+    wait([cluster_info, schema, mv_errors])
+
+    errors: dict[str, str] = {}
+    return DashboardBundle(
+        cluster_info=_future_result(cluster_info, "cluster_info", errors),
+        schema=_future_result(schema, "schema", errors),
+        mv_errors=_future_result(mv_errors, "mv_errors", errors),
+        errors=errors,
+    )
+
+
+def _future_result(future: Future[Any], name: str, errors: dict[str, str]) -> Any:
+    """Return a fetch future's result, or record its failure under *name*."""
+    try:
+        return future.result()
+    except Exception as e:
+        errors[name] = str(e)
+        return None
+
 
 class ClickHouseRepository:
     """Repository for ClickHouse data access."""
 
     def __init__(self) -> None:
         self._client = ClickHouseClient()
+        self._conn: Optional[Client] = None
+
+    def _get_client(self) -> Client:
+        """Return the ClickHouse client, resolving it on first use."""
+        if self._conn is None:
+            self._conn = self._client.get_client()
+        return self._conn
+
+    def _query_df(
+        self, query: str, params: dict[str, Any], columns: list[str]
+    ) -> pd.DataFrame:
+        """Run a query through the column-oriented, streamed DataFrame path.
+
+        Each native-format block arrives as its own DataFrame built straight
+        from NumPy buffers, so no per-row Python tuples are materialized. The
+        blocks are collected and joined with a single ``pd.concat``, so a
+        multi-block result briefly holds both the blocks and the joined copy.
+        """
+        client = self._get_client()
+        with client.query_df_stream(query, parameters=params) as stream:
+            frames = list(stream)
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        if len(frames[0].columns) != len(columns):
+            raise ValueError(
+                f"Query returned {len(frames[0].columns)} columns, "
+                f"expected {len(columns)}: {columns}"
+            )
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        df.columns = columns
+        return df
 
     def fetch_databases(self) -> list[str]:
         """Fetch list of all user databases."""
-        client = self._client.get_client()
+        client = self._get_client()
         result = client.query(
             """
             SELECT name
@@ -30,18 +120,20 @@ class ClickHouseRepository:
     def fetch_schema(self, database: Optional[str] = None) -> pd.DataFrame:
         """Fetch all non-system tables."""
         query, params = queries.build_system_tables_query(database)
-        client = self._client.get_client()
+        client = self._get_client()
         result = client.query(query, parameters=params)
 
-        return pd.DataFrame(
+        df = pd.DataFrame(
             result.result_rows,
             columns=["database", "name", "engine", "total_rows", "total_bytes"],
         )
+        # Few distinct databases/engines across many tables
+        return df.astype({"database": "category", "engine": "category"})
 
     def fetch_materialized_views(self, database: Optional[str] = None) -> pd.DataFrame:
         """Fetch all materialized views with their create queries and dependencies."""
         query, params = queries.build_materialized_views_query(database)
-        client = self._client.get_client()
+        client = self._get_client()
         result = client.query(query, parameters=params)
 
         return pd.DataFrame(
@@ -55,15 +147,13 @@ class ClickHouseRepository:
             ],
         )
 
-    def fetch_storage_metrics(self, database: Optional[str] = None) -> pd.DataFrame:
-        """Fetch storage metrics from active parts, grouped by database/table."""
-        query, params = queries.build_storage_metrics_query(database)
-        client = self._client.get_client()
-        result = client.query(query, parameters=params)
-
-        return pd.DataFrame(
-            result.result_rows,
-            columns=[
+    def fetch_storage_detail(self, database: str, table: str) -> pd.DataFrame:
+        """Fetch storage metrics, including uncompressed size, for one table."""
+        query, params = queries.build_storage_detail_query(database, table)
+        df = self._query_df(
+            query,
+            params,
+            [
                 "database",
                 "table",
                 "rows",
@@ -73,15 +163,24 @@ class ClickHouseRepository:
             ],
         )
 
+        # Ratio precomputed once per frame; NaN where either size is zero
+        comp = df["compressed_bytes"].to_numpy(dtype=np.float64)
+        uncomp = df["uncompressed_bytes"].to_numpy(dtype=np.float64)
+        df["compression_ratio"] = np.divide(
+            uncomp,
+            comp,
+            out=np.full_like(comp, np.nan),
+            where=(comp > 0) & (uncomp > 0),
+        )
+        return df
+
     def fetch_partition_storage(self, database: Optional[str] = None) -> pd.DataFrame:
         """Fetch partition-level storage metrics for treemap visualization."""
         query, params = queries.build_partition_storage_query(database)
-        client = self._client.get_client()
-        result = client.query(query, parameters=params)
-
-        return pd.DataFrame(
-            result.result_rows,
-            columns=[
+        df = self._query_df(
+            query,
+            params,
+            [
                 "database",
                 "table",
                 "partition",
@@ -90,11 +189,13 @@ class ClickHouseRepository:
                 "compressed_bytes",
             ],
         )
+        # Each table repeats once per partition
+        return df.astype({"database": "category", "table": "category"})
 
-    def fetch_cluster_info(self, database: Optional[str] = None) -> dict:
+    def fetch_cluster_info(self, database: Optional[str] = None) -> dict[str, Any]:
         """Fetch cluster overview info."""
         query, params = queries.build_cluster_info_query(database)
-        client = self._client.get_client()
+        client = self._get_client()
         result = client.query(query, parameters=params)
 
         row = result.first_row
@@ -114,12 +215,10 @@ class ClickHouseRepository:
         # Try query_views_log first (newer ClickHouse versions)
         try:
             query, params = queries.build_mv_throughput_query(hours, database)
-            client = self._client.get_client()
-            result = client.query(query, parameters=params)
-
-            return pd.DataFrame(
-                result.result_rows,
-                columns=[
+            df = self._query_df(
+                query,
+                params,
+                [
                     "view_name",
                     "interval_start",
                     "executions",
@@ -129,6 +228,9 @@ class ClickHouseRepository:
                     "avg_duration_ms",
                 ],
             )
+            # One row per view per interval: the names repeat heavily, and the
+            # categories double as the sorted MV filter options
+            return df.astype({"view_name": "category"})
         except Exception:
             pass
 
@@ -145,55 +247,55 @@ class ClickHouseRepository:
             ]
         )
 
+    def fetch_throughput_totals(
+        self, hours: int = 24, database: Optional[str] = None
+    ) -> ThroughputTotals:
+        """Fetch MV execution/row totals aggregated server-side."""
+        query, params = queries.build_throughput_totals_query(hours, database)
+        client = self._get_client()
+        result = client.query(query, parameters=params)
+
+        row = result.first_row
+        return {
+            "executions": row[0],
+            "rows_written": row[1],
+            "avg_duration_ms": row[2],
+        }
+
     def fetch_recent_throughput(
         self, minutes: int = 30, database: Optional[str] = None
     ) -> pd.DataFrame:
         """Fetch last N minutes of MV throughput."""
         try:
             query, params = queries.build_recent_throughput_query(minutes, database)
-            client = self._client.get_client()
-            result = client.query(query, parameters=params)
-
-            return pd.DataFrame(
-                result.result_rows,
-                columns=["view_name", "interval_start", "rows_written"],
+            return self._query_df(
+                query,
+                params,
+                ["view_name", "interval_start", "rows_written"],
             )
         except Exception:
             return pd.DataFrame(columns=["view_name", "interval_start", "rows_written"])
 
     def fetch_create_table(self, database: str, table: str) -> str:
         """Fetch the CREATE TABLE statement for a given table."""
-        client = self._client.get_client()
         try:
-            result = client.query(
-                "SHOW CREATE TABLE %(db)s.%(tbl)s",
-                parameters={"db": database, "tbl": table},
-            )
-            return result.first_row[0]
-        except Exception:
-            # Fallback: use backtick quoting
-            try:
-                result = client.query(f"SHOW CREATE TABLE `{database}`.`{table}`")
-                return result.first_row[0]
-            except Exception as e:
-                return f"-- Error fetching CREATE TABLE: {e}"
+            query, params = queries.build_show_create_query(database, table)
+            client = self._get_client()
+            result = client.query(query, parameters=params)
+            return str(result.first_row[0])
+        except Exception as e:
+            return f"-- Error fetching CREATE TABLE: {e}"
 
     def fetch_create_view(self, database: str, view: str) -> str:
         """Fetch the CREATE VIEW or CREATE MATERIALIZED VIEW statement."""
-        client = self._client.get_client()
+        # SHOW CREATE TABLE also returns the DDL of plain and materialized views
         try:
-            result = client.query(
-                "SHOW CREATE VIEW %(db)s.%(view)s",
-                parameters={"db": database, "view": view},
-            )
-            return result.first_row[0]
-        except Exception:
-            # Try as materialized view
-            try:
-                result = client.query(f"SHOW CREATE TABLE `{database}`.`{view}`")
-                return result.first_row[0]
-            except Exception as e:
-                return f"-- Error fetching CREATE VIEW: {e}"
+            query, params = queries.build_show_create_query(database, view)
+            client = self._get_client()
+            result = client.query(query, parameters=params)
+            return str(result.first_row[0])
+        except Exception as e:
+            return f"-- Error fetching CREATE VIEW: {e}"
 
     def fetch_mv_errors(
         self, hours: int = 24, database: Optional[str] = None
@@ -201,7 +303,7 @@ class ClickHouseRepository:
         """Fetch MV errors from query_views_log."""
         try:
             query, params = queries.build_mv_errors_query(hours, database)
-            client = self._client.get_client()
+            client = self._get_client()
             result = client.query(query, parameters=params)
 
             df = pd.DataFrame(
@@ -225,7 +327,7 @@ class ClickHouseRepository:
         try:
             # First check if any Kafka tables exist
             check_query, check_params = queries.build_kafka_check_query(database)
-            client = self._client.get_client()
+            client = self._get_client()
             check = client.query(check_query, parameters=check_params)
 
             if check.first_row[0] == 0:
@@ -1,9 +1,17 @@
-"""Lineage engine public API."""
+"""Lineage engine public API.
+
+``render_lineage_graph`` is imported on first access (PEP 562) so the graph,
+parser and layout modules can be used without loading streamlit_flow.
+"""
+
+from typing import TYPE_CHECKING, Any
 
 from chview.lineage.graph import LineageEdge, LineageGraph, TableNode, build_lineage
 from chview.lineage.layout import calculate_positions, get_connected_subgraph
 from chview.lineage.parser import parse_source_tables, parse_target_table
-from chview.lineage.renderer import render_lineage_graph
+
+if TYPE_CHECKING:
+    from chview.lineage.renderer import render_lineage_graph
 
 __all__ = [
     "build_lineage",
@@ -16,3 +24,11 @@ __all__ = [
     "render_lineage_graph",
     "TableNode",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "render_lineage_graph":
+        from chview.lineage.renderer import render_lineage_graph
+
+        return render_lineage_graph
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
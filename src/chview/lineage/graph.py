@@ -5,10 +5,14 @@ from typing import Optional
 
 import pandas as pd
 
+from chview.core.models import _SLOTS
 from chview.lineage.parser import parse_source_tables, parse_target_table
 
+# Longest node name shown untruncated on a lineage graph card
+_DISPLAY_NAME_MAX = 35
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class TableNode:
     """Represents a table or materialized view in the lineage graph."""
 
@@ -16,13 +20,26 @@ class TableNode:
     name: str
     engine: str
     full_name: str = ""
+    display_name: str = ""
 
     def __post_init__(self) -> None:
+        # Frozen: derived fields are filled in through object.__setattr__
         if not self.full_name:
-            self.full_name = f"{self.database}.{self.name}"
-
-
-@dataclass
+            object.__setattr__(self, "full_name", f"{self.database}.{self.name}")
+        if not self.display_name:
+            name = self.name
+            object.__setattr__(
+                self,
+                "display_name",
+                (
+                    name
+                    if len(name) <= _DISPLAY_NAME_MAX
+                    else name[: _DISPLAY_NAME_MAX - 3] + "..."
+                ),
+            )
+
+
+@dataclass(frozen=True, **_SLOTS)
 class LineageEdge:
     """Represents a data flow edge in the lineage graph."""
 
@@ -41,6 +58,14 @@ class LineageGraph:
     target_names: set[str] = field(default_factory=set)
 
 
+def _make_node(node_id: str, default_database: str, engine: str) -> TableNode:
+    """Create a node for a table id, reusing the id as full_name when qualified."""
+    database, sep, name = node_id.partition(".")
+    if not sep:
+        return TableNode(default_database, node_id, engine)
+    return TableNode(database, name, engine, node_id)
+
+
 def build_lineage(
     mv_df: pd.DataFrame, schema_df: Optional[pd.DataFrame] = None
 ) -> LineageGraph:
@@ -55,53 +80,56 @@ def build_lineage(
         Fully populated LineageGraph
     """
     lineage = LineageGraph()
+    edges: list[tuple[str, str, str]] = []
 
     # Build lookup for actual engine types from schema
     engine_lookup: dict[str, str] = {}
     if schema_df is not None and not schema_df.empty:
-        for _, row in schema_df.iterrows():
-            full_name = f"{row['database']}.{row['name']}"
-            engine_lookup[full_name] = row.get("engine", "Unknown")
-
-    for _, row in mv_df.iterrows():
-        db = row["database"]
-        mv_name = row["name"]
-        create_query = row["create_table_query"]
+        full_names = (
+            schema_df["database"].astype(str) + "." + schema_df["name"].astype(str)
+        )
+        engines = schema_df.get("engine", pd.Series("Unknown", index=schema_df.index))
+        engines = engines.astype(object).fillna("Unknown")  # may be categorical
+        engine_lookup = dict(zip(full_names.to_numpy(), engines))
+
+    # Zip over columns rather than iterrows() to avoid a Series per row
+    no_deps = [()] * len(mv_df)
+    mv_rows = zip(
+        mv_df["database"],
+        mv_df["name"],
+        mv_df["create_table_query"],
+        mv_df.get("dependencies_database", no_deps),
+        mv_df.get("dependencies_table", no_deps),
+    )
+    for db, mv_name, create_query, deps_db, deps_table in mv_rows:
         mv_full_name = f"{db}.{mv_name}"
 
-        lineage.nodes[mv_full_name] = TableNode(db, mv_name, "MaterializedView")
+        lineage.nodes[mv_full_name] = TableNode(
+            db, mv_name, "MaterializedView", mv_full_name
+        )
         lineage.mv_names.add(mv_full_name)
 
         sources = parse_source_tables(create_query, db)
 
         # Merge explicit ClickHouse dependency metadata
-        deps_db = row.get("dependencies_database", [])
-        deps_table = row.get("dependencies_table", [])
         if isinstance(deps_db, (list, tuple)) and isinstance(deps_table, (list, tuple)):
-            for dep_db, dep_tbl in zip(deps_db, deps_table):
-                dep_full = f"{dep_db}.{dep_tbl}"
-                if dep_full not in sources:
-                    sources.append(dep_full)
+            dep_names = (f"{d}.{t}" for d, t in zip(deps_db, deps_table))
+            sources = tuple(dict.fromkeys((*sources, *dep_names)))
 
         for source in sources:
             if source not in lineage.nodes:
-                parts = source.split(".", 1)
-                source_db = parts[0] if len(parts) > 1 else db
-                source_name = parts[1] if len(parts) > 1 else parts[0]
                 actual_engine = engine_lookup.get(source, "Source")
-                lineage.nodes[source] = TableNode(source_db, source_name, actual_engine)
-            lineage.edges.append(LineageEdge(source, mv_full_name, mv_full_name))
+                lineage.nodes[source] = _make_node(source, db, actual_engine)
+            edges.append((source, mv_full_name, mv_full_name))
 
         target, is_implicit = parse_target_table(create_query, db, mv_name)
         if target not in lineage.nodes:
-            parts = target.split(".", 1)
-            target_db = parts[0] if len(parts) > 1 else db
-            target_name = parts[1] if len(parts) > 1 else parts[0]
             actual_engine = engine_lookup.get(target)
             if actual_engine is None:
                 actual_engine = "implicit" if is_implicit else "target"
-            lineage.nodes[target] = TableNode(target_db, target_name, actual_engine)
+            lineage.nodes[target] = _make_node(target, db, actual_engine)
         lineage.target_names.add(target)
-        lineage.edges.append(LineageEdge(mv_full_name, target, mv_full_name))
+        edges.append((mv_full_name, target, mv_full_name))
 
+    lineage.edges = [LineageEdge(*e) for e in edges]
     return lineage
@@ -1,38 +1,48 @@
 """Node positioning and layout algorithms for the lineage graph."""
 
+from collections import deque
+
+import numpy as np
+
 from chview.lineage.graph import LineageGraph
 
 
-def _find_clusters(lineage: LineageGraph) -> list[set[str]]:
+def _build_adjacency(
+    lineage: LineageGraph,
+) -> tuple[dict[str, list[str]], dict[str, list[str]]]:
+    """Build (incoming, outgoing) adjacency maps in a single pass over the edges."""
+    incoming_map: dict[str, list[str]] = {}
+    outgoing_map: dict[str, list[str]] = {}
+    for e in lineage.edges:
+        incoming_map.setdefault(e.target, []).append(e.source)
+        outgoing_map.setdefault(e.source, []).append(e.target)
+    return incoming_map, outgoing_map
+
+
+def _find_clusters(
+    lineage: LineageGraph,
+    incoming_map: dict[str, list[str]],
+    outgoing_map: dict[str, list[str]],
+) -> list[set[str]]:
     """Find connected components (clusters) in the graph.
 
     Each cluster is a set of node IDs that are transitively connected.
     """
-    downstream: dict[str, list[str]] = {}
-    upstream: dict[str, list[str]] = {}
-    for edge in lineage.edges:
-        downstream.setdefault(edge.source, []).append(edge.target)
-        upstream.setdefault(edge.target, []).append(edge.source)
-
     visited: set[str] = set()
     clusters: list[set[str]] = []
 
     for node_id in lineage.nodes:
         if node_id in visited:
             continue
-        cluster: set[str] = set()
-        queue = [node_id]
+        # Mark nodes on enqueue so each one is queued at most once
+        cluster = {node_id}
+        queue = deque([node_id])
         while queue:
-            n = queue.pop(0)
-            if n in cluster:
-                continue
-            cluster.add(n)
-            for child in downstream.get(n, []):
-                if child not in cluster:
-                    queue.append(child)
-            for parent in upstream.get(n, []):
-                if parent not in cluster:
-                    queue.append(parent)
+            n = queue.popleft()
+            for neighbor in (*outgoing_map.get(n, ()), *incoming_map.get(n, ())):
+                if neighbor not in cluster:
+                    cluster.add(neighbor)
+                    queue.append(neighbor)
         visited |= cluster
         clusters.append(cluster)
 
@@ -41,7 +51,46 @@ def _find_clusters(lineage: LineageGraph) -> list[set[str]]:
 
 def _get_cluster_sort_key(cluster: set[str]) -> str:
     """Sort key for a cluster: alphabetically by earliest source node name."""
-    return min(sorted(cluster))
+    return min(cluster)
+
+
+def _compute_levels(
+    lineage: LineageGraph,
+    incoming_map: dict[str, list[str]],
+    outgoing_map: dict[str, list[str]],
+) -> dict[str, int]:
+    """Assign each node its longest-path depth from a source (Kahn's algorithm).
+
+    A node is levelled once all its parents are, so each edge is visited once.
+    If only cycles remain, the first unlevelled node (in graph order) is levelled
+    from whichever parents are already placed, which breaks the cycle.
+    """
+    node_ids = dict.fromkeys(lineage.nodes)
+    for e in lineage.edges:
+        node_ids.setdefault(e.source)
+        node_ids.setdefault(e.target)
+
+    in_degree = {n: len(incoming_map.get(n, ())) for n in node_ids}
+    queue = deque(n for n, deg in in_degree.items() if deg == 0)
+    unvisited = iter(node_ids)
+    levels: dict[str, int] = {}
+
+    while len(levels) < len(node_ids):
+        if not queue:
+            queue.append(next(n for n in unvisited if n not in levels))
+        node_id = queue.popleft()
+        if node_id in levels:
+            continue
+        parent_levels = [
+            levels[p] for p in incoming_map.get(node_id, ()) if p in levels
+        ]
+        levels[node_id] = max(parent_levels) + 1 if parent_levels else 0
+        for child in outgoing_map.get(node_id, ()):
+            in_degree[child] -= 1
+            if in_degree[child] == 0:
+                queue.append(child)
+
+    return levels
 
 
 def calculate_positions(lineage: LineageGraph) -> dict[str, tuple[float, float]]:
@@ -60,36 +109,14 @@ def calculate_positions(lineage: LineageGraph) -> dict[str, tuple[float, float]]
     if not lineage.nodes:
         return {}
 
-    # --- Compute topological levels ---
-    levels: dict[str, int] = {}
-    visiting: set[str] = set()
-
-    def get_level(node_id: str) -> int:
-        if node_id in levels:
-            return levels[node_id]
-        if node_id in visiting:
-            levels[node_id] = 0
-            return 0
-        visiting.add(node_id)
-        incoming = [e.source for e in lineage.edges if e.target == node_id]
-        if not incoming:
-            levels[node_id] = 0
-        else:
-            max_parent_level = max(get_level(parent) for parent in incoming)
-            levels[node_id] = max_parent_level + 1
-        visiting.discard(node_id)
-        return levels[node_id]
+    # --- Build adjacency maps (shared by every step below) ---
+    incoming_map, outgoing_map = _build_adjacency(lineage)
 
-    for node_id in lineage.nodes:
-        get_level(node_id)
-
-    # --- Build adjacency maps ---
-    incoming_map: dict[str, list[str]] = {}
-    for e in lineage.edges:
-        incoming_map.setdefault(e.target, []).append(e.source)
+    # --- Compute topological levels ---
+    levels = _compute_levels(lineage, incoming_map, outgoing_map)
 
     # --- Find and sort clusters ---
-    clusters = _find_clusters(lineage)
+    clusters = _find_clusters(lineage, incoming_map, outgoing_map)
     clusters.sort(key=_get_cluster_sort_key)
 
     # --- Layout constants ---
@@ -128,14 +155,14 @@ def calculate_positions(lineage: LineageGraph) -> dict[str, tuple[float, float]]
         # Place nodes: x by level, y within cluster band
         for lvl in sorted(cluster_by_level.keys()):
             nodes = cluster_by_level[lvl]
+            # Integer arithmetic, so level spacing is exact in the float result
             x = float(lvl * x_spacing + 80)
             # Center this column vertically within the cluster band
             col_height = (len(nodes) - 1) * y_spacing
             band_height = (max_rows - 1) * y_spacing
             y_offset = current_y + (band_height - col_height) / 2
-            for i, node_id in enumerate(nodes):
-                y = y_offset + i * y_spacing
-                positions[node_id] = (x, y)
+            ys = np.arange(len(nodes), dtype=np.float64) * y_spacing + y_offset
+            positions.update(zip(nodes, ((x, y) for y in ys.tolist())))
 
         # Advance y cursor past this cluster
         band_height = (max_rows - 1) * y_spacing
@@ -143,9 +170,9 @@ def calculate_positions(lineage: LineageGraph) -> dict[str, tuple[float, float]]
 
     # Center everything around y=0
     if positions:
-        all_ys = [p[1] for p in positions.values()]
-        y_center = (min(all_ys) + max(all_ys)) / 2
-        positions = {nid: (x, y - y_center) for nid, (x, y) in positions.items()}
+        coords = np.array(list(positions.values()), dtype=np.float64)
+        coords[:, 1] -= (coords[:, 1].min() + coords[:, 1].max()) / 2
+        positions = dict(zip(positions, map(tuple, coords.tolist())))
 
     return positions
 
@@ -163,26 +190,21 @@ def get_connected_subgraph(lineage: LineageGraph, selected_id: str) -> set[str]:
         Set of all directly or transitively connected node IDs (including selected_id)
     """
     connected = {selected_id}
-
-    downstream: dict[str, list[str]] = {}
-    upstream: dict[str, list[str]] = {}
-    for edge in lineage.edges:
-        downstream.setdefault(edge.source, []).append(edge.target)
-        upstream.setdefault(edge.target, []).append(edge.source)
+    upstream, downstream = _build_adjacency(lineage)
 
     # BFS downstream
-    queue = [selected_id]
+    queue = deque([selected_id])
     while queue:
-        node = queue.pop(0)
+        node = queue.popleft()
         for child in downstream.get(node, []):
             if child not in connected:
                 connected.add(child)
                 queue.append(child)
 
     # BFS upstream
-    queue = [selected_id]
+    queue = deque([selected_id])
     while queue:
-        node = queue.pop(0)
+        node = queue.popleft()
         for parent in upstream.get(node, []):
             if parent not in connected:
                 connected.add(parent)
@@ -1,8 +1,19 @@
 """SQL parsing utilities for extracting table references from CREATE statements."""
 
+import functools
 import re
+from typing import Optional
 
+# Optionally backtick-quoted identifier, optionally qualified with a database
+_TABLE_PAT = r"(?:`[^`]+`|[a-zA-Z_]\w*)(?:\.(?:`[^`]+`|[a-zA-Z_]\w*))?"
+_TABLE_RE = re.compile(_TABLE_PAT)
+_AS_SELECT_RE = re.compile(r"\bAS\s+SELECT\b", re.IGNORECASE | re.DOTALL)
+_SRC_RE = re.compile(rf"\b(?:FROM|JOIN)\s+({_TABLE_PAT})", re.IGNORECASE)
+_TO_RE = re.compile(rf"\bTO\s+({_TABLE_PAT})", re.IGNORECASE)
+_BACKTICK_TRANS = str.maketrans("", "", "`")
 
+
+@functools.lru_cache(maxsize=4096)
 def _qualify_table_name(table_ref: str, default_database: str) -> str:
     """Qualify a table reference with a database prefix if not already qualified.
 
@@ -13,43 +24,72 @@ def _qualify_table_name(table_ref: str, default_database: str) -> str:
     Returns:
         Fully qualified table name as "database.table"
     """
-    table_ref = table_ref.replace("`", "").strip()
+    table_ref = table_ref.translate(_BACKTICK_TRANS).strip()
     if "." in table_ref:
         return table_ref
     return f"{default_database}.{table_ref}"
 
 
-def parse_source_tables(create_query: str, mv_database: str) -> list[str]:
+def _single_from_source(select_part: str) -> Optional[str]:
+    """Return the table of a SELECT with exactly one FROM and no JOIN, else None.
+
+    Covers the common single-source MV with plain string scans plus one
+    anchored match; anything else falls back to the full regex pass.
+    """
+    lowered = select_part.lower()
+    if "join" in lowered or lowered.count("from") != 1:
+        return None
+
+    pos = lowered.find("from")
+    if pos > 0 and (select_part[pos - 1].isalnum() or select_part[pos - 1] == "_"):
+        return None
+
+    end = pos + 4
+    if end >= len(select_part) or not select_part[end].isspace():
+        return None
+    while end < len(select_part) and select_part[end].isspace():
+        end += 1
+
+    m = _TABLE_RE.match(select_part, end)
+    return m.group(0) if m else None
+
+
+def _regex_source_tables(select_part: str, mv_database: str) -> tuple[str, ...]:
+    """Collect every FROM/JOIN table reference in a SELECT body."""
+    sources = {
+        _qualify_table_name(m.group(1), mv_database)
+        for m in _SRC_RE.finditer(select_part)
+    }
+    return tuple(sorted(sources))
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_source_tables(create_query: str, mv_database: str) -> tuple[str, ...]:
     """Parse source tables from a CREATE MATERIALIZED VIEW SQL statement.
 
     Extracts all FROM and JOIN references from the SELECT portion of the query.
+    Memoized per DDL, since graph rebuilds re-see unchanged MVs; the result is
+    an immutable tuple, so it is safe to share between callers.
 
     Args:
         create_query: Full CREATE MATERIALIZED VIEW SQL
         mv_database: Database of the MV (used to qualify unqualified table refs)
 
     Returns:
-        Sorted list of fully qualified source table names
+        Sorted tuple of fully qualified source table names
     """
-    match = re.search(r"\bAS\s+SELECT\b", create_query, re.IGNORECASE | re.DOTALL)
+    match = _AS_SELECT_RE.search(create_query)
     if not match:
-        return []
+        return ()
 
     select_part = create_query[match.start() :]
-    table_pattern = r"(?:`[^`]+`|[a-zA-Z_]\w*)(?:\.(?:`[^`]+`|[a-zA-Z_]\w*))?"
-    sources: set[str] = set()
-
-    from_pattern = rf"\bFROM\s+({table_pattern})"
-    for m in re.finditer(from_pattern, select_part, re.IGNORECASE):
-        sources.add(_qualify_table_name(m.group(1), mv_database))
-
-    join_pattern = rf"\bJOIN\s+({table_pattern})"
-    for m in re.finditer(join_pattern, select_part, re.IGNORECASE):
-        sources.add(_qualify_table_name(m.group(1), mv_database))
-
-    return sorted(sources)
+    single = _single_from_source(select_part)
+    if single is not None:
+        return (_qualify_table_name(single, mv_database),)
+    return _regex_source_tables(select_part, mv_database)
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_target_table(
     create_query: str, mv_database: str, mv_name: str
 ) -> tuple[str, bool]:
@@ -64,8 +104,7 @@ def parse_target_table(
         Tuple of (fully_qualified_target_name, is_implicit)
         where is_implicit=True means the MV uses an inner/implicit storage table
     """
-    table_pattern = r"(?:`[^`]+`|[a-zA-Z_]\w*)(?:\.(?:`[^`]+`|[a-zA-Z_]\w*))?"
-    to_match = re.search(rf"\bTO\s+({table_pattern})", create_query, re.IGNORECASE)
+    to_match = _TO_RE.search(create_query)
     if to_match:
         return _qualify_table_name(to_match.group(1), mv_database), False
     return f"{mv_database}.`.inner.{mv_name}`", True
@@ -1,6 +1,8 @@
 """Streamlit Flow rendering for the lineage graph."""
 
-from typing import Optional
+import time
+from collections.abc import Set
+from typing import Any, Optional
 
 import streamlit as st
 from streamlit_flow import streamlit_flow
@@ -52,6 +54,72 @@ _NODE_STYLES: dict[str, dict[str, str]] = {
 }
 
 
+# Node-type legend shown above the graph; depends only on _NODE_STYLES
+_LEGEND_HTML = (
+    '<div style="display: flex; justify-content: center; align-items: center; gap: 24px; margin-bottom: 1rem; padding: 12px 20px; background: hsl(220 88% 17% / 0.04); border-radius: 8px; border: 1px solid hsl(213 87% 15% / 0.20);">'
+    + "".join(
+        '<div style="display: flex; align-items: center; gap: 8px;">'
+        f'<span style="width: 28px; height: 16px; background: {style["bg"]}; border: 2px solid {style["border"]}; border-radius: 4px; display: inline-block;"></span>'
+        f'<span style="font-size: 13px; color: #636B7F; font-weight: 500;">{style["label"]}</span>'
+        "</div>"
+        for style in _NODE_STYLES.values()
+    )
+    + "</div>"
+)
+
+# Per-engine node CSS, formatted once; each node copies its base style
+_NODE_BASE_STYLES: dict[str, dict[str, str]] = {
+    engine: {
+        "background": style["bg"],
+        "border": f"2px solid {style['border']}",
+        "borderRadius": "12px",
+        "padding": "16px 20px",
+        "fontSize": "14px",
+        "fontFamily": "Inter, -apple-system, sans-serif",
+        "fontWeight": "400",
+        "color": "#0D1525",
+        "width": "260px",
+        "textAlign": "left",
+        "cursor": "pointer",
+        "boxShadow": f"0 2px 8px {style['shadow']}",
+    }
+    for engine, style in _NODE_STYLES.items()
+}
+# Dimmed nodes share one style per engine, so never mutate these
+_NODE_DIMMED_STYLES: dict[str, dict[str, str]] = {
+    engine: {
+        **style,
+        "opacity": "0.15",
+        "filter": "grayscale(0.5)",
+        "boxShadow": "none",
+    }
+    for engine, style in _NODE_BASE_STYLES.items()
+}
+_NODE_CONTENT_PREFIXES: dict[str, str] = {
+    engine: f"**{style['icon']} {style['label']}**\n\n"
+    for engine, style in _NODE_STYLES.items()
+}
+_NODE_HIGHLIGHT_SHADOWS: dict[str, str] = {
+    engine: f"0 0 0 3px {style['border']}40, 0 4px 12px {style['shadow']}"
+    for engine, style in _NODE_STYLES.items()
+}
+
+# Edge styles keyed by (source is MV, dimmed) and arrow markers keyed by
+# "source is MV"; shared across edges, so never mutate them
+_EDGE_COLORS = {True: "#E51745", False: "#07A4AE"}
+_EDGE_STYLES: dict[tuple[bool, bool], dict[str, str]] = {
+    (is_mv, False): {"stroke": color, "strokeWidth": "1.5"}
+    for is_mv, color in _EDGE_COLORS.items()
+} | {
+    (is_mv, True): {"stroke": color, "strokeWidth": "1", "opacity": "0.08"}
+    for is_mv, color in _EDGE_COLORS.items()
+}
+_EDGE_MARKERS: dict[bool, dict[str, str]] = {
+    is_mv: {"type": "arrowclosed", "color": color}
+    for is_mv, color in _EDGE_COLORS.items()
+}
+
+
 def _resolve_engine(full_name: str, lineage: LineageGraph) -> str:
     """Determine the visual engine category for a node."""
     if full_name in lineage.mv_names:
@@ -65,26 +133,41 @@ def _resolve_engine(full_name: str, lineage: LineageGraph) -> str:
 def _build_flow_state(
     lineage: LineageGraph,
     positions: dict[str, tuple[float, float]],
-    error_views: set[str],
+    error_views: Set[str],
     connected: Optional[set[str]],
     highlight_node: Optional[str] = None,
 ) -> StreamlitFlowState:
     """Build a StreamlitFlowState with styles based on the connected subgraph."""
-    flow_nodes = []
-    flow_edges = []
+    flow_nodes: list[StreamlitFlowNode] = []
+    flow_edges: list[StreamlitFlowEdge] = []
+    add_node = flow_nodes.append
+    add_edge = flow_edges.append
+
+    # Built once so node-type resolution is a set lookup, not an edge scan
+    has_incoming_edge = {e.target for e in lineage.edges}
+    has_outgoing_edge = {e.source for e in lineage.edges}
+    mv_names = lineage.mv_names
+    target_names = lineage.target_names
+    content_prefixes = _NODE_CONTENT_PREFIXES
+    base_styles = _NODE_BASE_STYLES
+    dimmed_styles = _NODE_DIMMED_STYLES
 
     for full_name, node in lineage.nodes.items():
-        engine = _resolve_engine(full_name, lineage)
-        style = _NODE_STYLES.get(engine, _NODE_STYLES["source"])
+        # Inlined _resolve_engine
+        if full_name in mv_names:
+            engine = "MaterializedView"
+        elif full_name in target_names:
+            engine = "implicit" if node.engine == "implicit" else "target"
+        else:
+            engine = "source"
         has_error = full_name in error_views
         is_dimmed = connected is not None and full_name not in connected
         is_highlighted = full_name == highlight_node
 
-        name = node.name if len(node.name) <= 35 else node.name[:32] + "..."
-        content = f"**{style['icon']} {style['label']}**\n\n{name}"
+        content = content_prefixes[engine] + node.display_name
 
-        has_incoming = any(e.target == full_name for e in lineage.edges)
-        has_outgoing = any(e.source == full_name for e in lineage.edges)
+        has_incoming = full_name in has_incoming_edge
+        has_outgoing = full_name in has_outgoing_edge
         if has_incoming and has_outgoing:
             node_type = "default"
         elif has_outgoing:
@@ -92,43 +175,21 @@ def _build_flow_state(
         else:
             node_type = "output"
 
-        border_color = style["border"]
-        shadow_color = style["shadow"]
-
-        node_style: dict[str, str] = {
-            "background": style["bg"],
-            "border": f"2px solid {border_color}",
-            "borderRadius": "12px",
-            "padding": "16px 20px",
-            "fontSize": "14px",
-            "fontFamily": "Inter, -apple-system, sans-serif",
-            "fontWeight": "400",
-            "color": "#0D1525",
-            "width": "260px",
-            "textAlign": "left",
-            "cursor": "pointer",
-            "boxShadow": f"0 2px 8px {shadow_color}",
-        }
-
-        if is_highlighted and not is_dimmed:
-            node_style["boxShadow"] = (
-                f"0 0 0 3px {border_color}40, 0 4px 12px {shadow_color}"
-            )
-
-        if has_error and not is_dimmed:
-            node_style["border"] = "2px solid #FF5C4D"
-            node_style["boxShadow"] = (
-                "0 0 0 3px rgba(255,92,77,0.15), 0 2px 8px rgba(255,92,77,0.20)"
-            )
-
         if is_dimmed:
-            node_style["opacity"] = "0.15"
-            node_style["filter"] = "grayscale(0.5)"
-            node_style["boxShadow"] = "none"
+            node_style = dimmed_styles[engine]
+        else:
+            node_style = base_styles[engine].copy()
+            if is_highlighted:
+                node_style["boxShadow"] = _NODE_HIGHLIGHT_SHADOWS[engine]
+            if has_error:
+                node_style["border"] = "2px solid #FF5C4D"
+                node_style["boxShadow"] = (
+                    "0 0 0 3px rgba(255,92,77,0.15), 0 2px 8px rgba(255,92,77,0.20)"
+                )
 
         pos = positions.get(full_name, (0, 0))
 
-        flow_nodes.append(
+        add_node(
             StreamlitFlowNode(
                 id=full_name,
                 pos=pos,
@@ -145,34 +206,92 @@ def _build_flow_state(
         )
 
     for i, edge in enumerate(lineage.edges):
-        is_mv = edge.source in lineage.mv_names
-        edge_color = "#E51745" if is_mv else "#07A4AE"
+        is_mv = edge.source in mv_names
         is_dimmed = connected is not None and (
             edge.source not in connected or edge.target not in connected
         )
 
-        edge_style: dict[str, str] = {"stroke": edge_color, "strokeWidth": "1.5"}
-        if is_dimmed:
-            edge_style["opacity"] = "0.08"
-            edge_style["strokeWidth"] = "1"
-
-        flow_edges.append(
+        add_edge(
             StreamlitFlowEdge(
                 id=f"e{i}",
                 source=edge.source,
                 target=edge.target,
                 edge_type="smoothstep",
                 animated=not is_dimmed,
-                marker_end={"type": "arrowclosed", "color": edge_color},
-                style=edge_style,
+                marker_end=_EDGE_MARKERS[is_mv],
+                style=_EDGE_STYLES[is_mv, is_dimmed],
             )
         )
 
     return StreamlitFlowState(nodes=flow_nodes, edges=flow_edges)
 
 
+def _lineage_fingerprint(lineage: LineageGraph) -> tuple[tuple[Any, ...], ...]:
+    """Hashable summary of everything in *lineage* that affects the flow state."""
+    return (
+        tuple((n, node.name, node.engine) for n, node in lineage.nodes.items()),
+        tuple((e.source, e.target) for e in lineage.edges),
+        tuple(sorted(lineage.mv_names)),
+        tuple(sorted(lineage.target_names)),
+    )
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _build_flow_state_cached(
+    fingerprint: tuple[Any, ...],
+    _lineage: LineageGraph,
+    _positions: dict[str, tuple[float, float]],
+    _error_views: Set[str],
+    _connected: Optional[set[str]],
+    highlight_node: Optional[str],
+) -> StreamlitFlowState:
+    """Cached ``_build_flow_state``; *fingerprint* stands in for the ``_`` args."""
+    return _build_flow_state(
+        _lineage, _positions, _error_views, _connected, highlight_node
+    )
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _calculate_positions_cached(
+    fingerprint: tuple[Any, ...], _lineage: LineageGraph
+) -> dict[str, tuple[float, float]]:
+    """Cached ``calculate_positions``; layout depends only on the topology."""
+    return calculate_positions(_lineage)
+
+
+_STATE_CACHE_KEY = "_lineage_state_cache"
+_SHOWN_HIGHLIGHT_KEY = "_lineage_shown_highlight"
+_HANDLED_CLICK_KEY = "_lineage_handled_click"
+_CONNECTED_KEY = "_lineage_connected"
+_ORIGIN: tuple[float, float] = (0.0, 0.0)
+# Per-session cap on the highlight-keyed caches (subgraphs and flow states);
+# the oldest entry is evicted first
+_HIGHLIGHT_CACHE_MAX_ENTRIES = 8
+
+
+def _connected_subgraph_cached(
+    lineage: LineageGraph, highlight_node: Optional[str]
+) -> Optional[set[str]]:
+    """Return the highlighted node's connected subgraph, memoized per session.
+
+    Entries are dropped along with the flow states when the lineage changes.
+    """
+    if highlight_node is None:
+        return None
+    cache: dict[str, set[str]] = st.session_state.setdefault(_CONNECTED_KEY, {})
+    connected = cache.get(highlight_node)
+    if connected is None:
+        connected = get_connected_subgraph(lineage, highlight_node)
+        if len(cache) >= _HIGHLIGHT_CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)))
+        cache[highlight_node] = connected
+    return connected
+
+
 def render_lineage_graph(
-    lineage: LineageGraph, error_views: Optional[set[str]] = None
+    lineage: LineageGraph,
+    error_views: Optional[Set[str]] = None,
+    computed_positions: Optional[dict[str, tuple[float, float]]] = None,
 ) -> Optional[str]:
     """Render the interactive lineage graph using streamlit-flow.
 
@@ -181,44 +300,80 @@ def render_lineage_graph(
     Args:
         lineage: The lineage graph to render
         error_views: Set of MV full names that have recent errors
+        computed_positions: Precomputed layout for *lineage*; calculated here
+            when omitted
 
     Returns:
         Currently highlighted node ID, or None
     """
-    error_views = error_views or set()
+    # frozenset() of a frozenset is a no-op, so the fingerprints below are free
+    error_views = frozenset(error_views or ())
 
     # --- Highlight state ---
     highlight_node: Optional[str] = st.session_state.get("lineage_highlight")
-    connected: Optional[set[str]] = None
-    if highlight_node and highlight_node in lineage.nodes:
-        connected = get_connected_subgraph(lineage, highlight_node)
-    else:
+    if not (highlight_node and highlight_node in lineage.nodes):
         st.session_state.pop("lineage_highlight", None)
         highlight_node = None
 
     # --- Cached flow state keyed by highlight to avoid unnecessary re-renders ---
-    state_key = f"_lineage_state_{highlight_node}"
     pos_key = "_lineage_positions"
     ever_rendered_key = "_lineage_ever_rendered"
 
-    flow_state: Optional[StreamlitFlowState] = st.session_state.get(state_key)
+    # Per-highlight states are only valid for the graph/errors they were built
+    # from; a single fingerprint comparison decides whether they can be reused
+    lineage_fp = _lineage_fingerprint(lineage)
+    content_fp = hash((lineage_fp, error_views))
+    if st.session_state.get("_lineage_fp") != content_fp:
+        st.session_state.pop(_STATE_CACHE_KEY, None)
+        st.session_state.pop(_CONNECTED_KEY, None)
+        st.session_state["_lineage_fp"] = content_fp
+
+    state_cache: dict[Optional[str], StreamlitFlowState] = st.session_state.setdefault(
+        _STATE_CACHE_KEY, {}
+    )
+    flow_state = state_cache.get(highlight_node)
+    highlight_changed = (
+        st.session_state.get(_SHOWN_HIGHLIGHT_KEY, highlight_node) != highlight_node
+    )
+    st.session_state[_SHOWN_HIGHLIGHT_KEY] = highlight_node
 
     if flow_state is None:
         cached_positions: dict[str, tuple[float, float]] = st.session_state.get(
             pos_key, {}
         )
-        computed_positions = calculate_positions(lineage)
+        if computed_positions is None:
+            computed_positions = _calculate_positions_cached(lineage_fp, lineage)
+        # Dragged positions win over the layout; one probe per node
+        merged = {**computed_positions, **cached_positions}
         positions: dict[str, tuple[float, float]] = {
-            node_id: cached_positions.get(
-                node_id, computed_positions.get(node_id, (0.0, 0.0))
-            )
-            for node_id in lineage.nodes
+            node_id: merged.get(node_id, _ORIGIN) for node_id in lineage.nodes
         }
 
-        flow_state = _build_flow_state(
-            lineage, positions, error_views, connected, highlight_node
+        connected = _connected_subgraph_cached(lineage, highlight_node)
+        fingerprint = (
+            lineage_fp,
+            tuple(positions.values()),
+            error_views,
         )
-        st.session_state[state_key] = flow_state
+        flow_state = _build_flow_state_cached(
+            fingerprint, lineage, positions, error_views, connected, highlight_node
+        )
+        # Cache hits are copies carrying the original build time; the component
+        # ignores states older than the one it last rendered
+        flow_state.timestamp = int(time.time() * 1000)
+        if len(state_cache) >= _HIGHLIGHT_CACHE_MAX_ENTRIES:
+            state_cache.pop(next(iter(state_cache)))
+        state_cache[highlight_node] = flow_state
+    elif highlight_changed:
+        # A resident state from an earlier visit to this highlight is older
+        # than what the component shows now: carry over nodes dragged since,
+        # then restamp it so it gets applied
+        dragged: dict[str, tuple[float, float]] = st.session_state.get(pos_key, {})
+        for flow_node in flow_state.nodes:
+            pos = dragged.get(flow_node.id)
+            if pos is not None:
+                flow_node.position = {"x": pos[0], "y": pos[1]}
+        flow_state.timestamp = int(time.time() * 1000)
 
     first_render = not st.session_state.get(ever_rendered_key, False)
     st.session_state[ever_rendered_key] = True
@@ -242,27 +397,29 @@ def render_lineage_graph(
         style={"background": "#FAFAFA"},
     )
 
-    # Cache positions from component result (preserves drag across highlight changes)
+    # Cache positions from component result (preserves drag across highlight
+    # changes); the result itself is not cached, as on highlight-induced reruns
+    # it still carries the previous highlight's styles
     if result is not None:
         pos_dict: dict[str, tuple[float, float]] = {}
         for n in result.nodes:
             p = n.position
             pos_dict[n.id] = (p["x"], p["y"])
         st.session_state[pos_key] = pos_dict
-        st.session_state[state_key] = result
-
-    # Skip stale result on highlight-induced reruns to prevent toggle loop
-    if st.session_state.pop("_lineage_skip_result", False):
-        return highlight_node
 
     # --- Handle click: toggle highlight ---
-    if result is not None and result.selected_id:
+    # The component replays its last value on every rerun; each event carries
+    # a fresh timestamp, so acting on a timestamp only once prevents toggle loops
+    if (
+        result is not None
+        and result.selected_id
+        and result.timestamp != st.session_state.get(_HANDLED_CLICK_KEY)
+    ):
+        st.session_state[_HANDLED_CLICK_KEY] = result.timestamp
         if result.selected_id == highlight_node:
             st.session_state.pop("lineage_highlight", None)
         else:
             st.session_state["lineage_highlight"] = result.selected_id
-        st.session_state.pop(state_key, None)
-        st.session_state["_lineage_skip_result"] = True
         st.rerun()
 
     return highlight_node
@@ -1,9 +1,24 @@
-"""Page render functions public API."""
+"""Page render functions public API.
 
-from chview.pages.lineage import render_lineage_page
-from chview.pages.metrics import render_metrics_page
-from chview.pages.overview import render_overview_page
-from chview.pages.tables import render_tables_page
+Page modules are imported on first attribute access (PEP 562), so loading one
+page does not pull in the dependencies of the others (e.g. streamlit_flow).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from chview.pages.lineage import render_lineage_page
+    from chview.pages.metrics import render_metrics_page
+    from chview.pages.overview import render_overview_page
+    from chview.pages.tables import render_tables_page
+
+_PAGE_MODULES = {
+    "render_lineage_page": "chview.pages.lineage",
+    "render_metrics_page": "chview.pages.metrics",
+    "render_overview_page": "chview.pages.overview",
+    "render_tables_page": "chview.pages.tables",
+}
 
 __all__ = [
     "render_lineage_page",
@@ -11,3 +26,10 @@ __all__ = [
     "render_overview_page",
     "render_tables_page",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _PAGE_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
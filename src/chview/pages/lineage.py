@@ -1,19 +1,83 @@
 """Lineage page: interactive MV data flow visualization."""
 
+import hashlib
 from typing import Optional
 
 import pandas as pd
 import streamlit as st
 
 from chview.components.tables import render_node_detail_sidebar
-from chview.lineage.graph import build_lineage
-from chview.lineage.renderer import _NODE_STYLES, _resolve_engine, render_lineage_graph
+from chview.lineage.graph import LineageGraph, build_lineage
+from chview.lineage.layout import calculate_positions
+from chview.lineage.renderer import (
+    _LEGEND_HTML,
+    _NODE_STYLES,
+    _resolve_engine,
+    render_lineage_graph,
+)
+
+_MV_COLUMNS = [
+    "database",
+    "name",
+    "create_table_query",
+    "dependencies_database",
+    "dependencies_table",
+]
+_SCHEMA_COLUMNS = ["database", "name", "engine"]
+
+# Toolbar HTML: the selected-node badge (filled from a _NODE_STYLES entry)
+# and the hint shown when nothing is highlighted
+_SELECTED_HTML = (
+    '<div style="font-size: 0.95rem; font-weight: 600; padding: 0.4rem 0;">'
+    '<span style="display: inline-block; padding: 2px 10px; border-radius: 6px;'
+    " background: {badge_bg}; color: {badge_text};"
+    ' font-size: 0.78rem; font-weight: 600; margin-right: 8px;">'
+    "{label}</span>"
+    '{database}.<span style="color: {border};">{name}</span>'
+    "</div>"
+)
+_HINT_HTML = '<div style="font-size: 0.95rem; padding: 0.4rem 0; color: #A4ABBA;">Click a node to highlight its connections</div>'
+
+# Detail panel header: engine badge followed by the bare node name
+_PANEL_HEADER_HTML = (
+    '<div style="font-size: 0.95rem; font-weight: 600; padding: 0.3rem 0 0.5rem;">'
+    '<span style="display: inline-block; padding: 2px 10px; border-radius: 6px;'
+    " background: {badge_bg}; color: {badge_text};"
+    ' font-size: 0.78rem; font-weight: 600; margin-right: 6px;">'
+    "{label}</span>"
+    "{name}</div>"
+)
+
+
+def _fingerprint(df: Optional[pd.DataFrame], columns: list[str]) -> str:
+    """Content hash of the given columns (list cells are hashed by their repr)."""
+    if df is None or df.empty:
+        return ""
+    present = [c for c in columns if c in df.columns]
+    hashed = pd.util.hash_pandas_object(df[present].astype(str), index=False)
+    return hashlib.sha1(hashed.to_numpy().tobytes()).hexdigest()
+
+
+@st.cache_resource(max_entries=4, ttl=300)
+def _build_lineage_layout(
+    key: tuple[str, str],
+    _mv_df: pd.DataFrame,
+    _schema_df: Optional[pd.DataFrame],
+) -> tuple[LineageGraph, dict[str, tuple[float, float]]]:
+    """Build the lineage graph and its layout once per MV/schema fingerprint.
+
+    Reruns with unchanged metadata skip re-parsing every CREATE query. The
+    frames are excluded from Streamlit's hashing; *key* identifies them.
+    Shared result — do not mutate.
+    """
+    lineage = build_lineage(_mv_df, _schema_df)
+    return lineage, calculate_positions(lineage)
 
 
 def render_lineage_page(
     load_materialized_views,
     load_schema,
-    load_storage_metrics,
+    load_storage_detail,
     load_recent_throughput,
     load_mv_errors,
     load_kafka_consumers,
@@ -26,17 +90,17 @@ def render_lineage_page(
     Args:
         load_materialized_views: Cached MV loader
         load_schema: Cached schema loader
-        load_storage_metrics: Cached storage metrics loader
+        load_storage_detail: Cached single-table storage metrics loader
         load_recent_throughput: Cached recent throughput loader
         load_mv_errors: Cached MV errors loader
         load_kafka_consumers: Cached Kafka consumers loader
         load_create_table: Cached CREATE TABLE fetcher
         load_create_view: Cached CREATE VIEW fetcher
-        database: Currently selected database filter
+        database: Currently selected database filter (None for all)
     """
     st.header("Lineage")
 
-    if database and database != "All":
+    if database:
         st.caption(f"Database: **{database}**")
 
     try:
@@ -48,7 +112,11 @@ def render_lineage_page(
             st.info("No materialized views found in this cluster.")
             return
 
-        lineage = build_lineage(mv_df, schema_df)
+        key = (
+            _fingerprint(mv_df, _MV_COLUMNS),
+            _fingerprint(schema_df, _SCHEMA_COLUMNS),
+        )
+        lineage, positions = _build_lineage_layout(key, mv_df, schema_df)
 
         # Metric cards
         c1, c2, c3, c4 = st.columns(4)
@@ -62,118 +130,80 @@ def render_lineage_page(
             st.metric("Targets", len(lineage.target_names))
 
         # Legend
-        legend_items = ""
-        for style in _NODE_STYLES.values():
-            legend_items += (
-                '<div style="display: flex; align-items: center; gap: 8px;">'
-                f'<span style="width: 28px; height: 16px; background: {style["bg"]}; border: 2px solid {style["border"]}; border-radius: 4px; display: inline-block;"></span>'
-                f'<span style="font-size: 13px; color: #636B7F; font-weight: 500;">{style["label"]}</span>'
-                "</div>"
-            )
-        st.markdown(
-            f'<div style="display: flex; justify-content: center; align-items: center; gap: 24px; margin-bottom: 1rem; padding: 12px 20px; background: hsl(220 88% 17% / 0.04); border-radius: 8px; border: 1px solid hsl(213 87% 15% / 0.20);">'
-            f"{legend_items}"
-            f"</div>",
-            unsafe_allow_html=True,
-        )
-
-        # Load supporting data
-        try:
-            storage_df = load_storage_metrics(database=database)
-        except Exception:
-            storage_df = pd.DataFrame()
+        st.markdown(_LEGEND_HTML, unsafe_allow_html=True)
 
         # Detect error MVs
-        error_views: set[str] = set()
+        error_views: frozenset[str] = frozenset()
         try:
             error_df = load_mv_errors(database=database)
             if error_df is not None and not error_df.empty:
-                error_views = set(error_df["view_name"].unique())
+                error_views = frozenset(error_df["view_name"].tolist())
         except Exception:
             pass
 
         # Toolbar row
         selected_id = st.session_state.get("lineage_highlight")
+        node = lineage.nodes.get(selected_id) if selected_id is not None else None
         toolbar_left, toolbar_right = st.columns([3, 1])
         with toolbar_left:
-            if selected_id and selected_id in lineage.nodes:
-                node = lineage.nodes[selected_id]
+            if selected_id is not None and node is not None:
                 engine = _resolve_engine(selected_id, lineage)
                 style = _NODE_STYLES.get(engine, _NODE_STYLES["source"])
-                badge_html = (
-                    f'<span style="display: inline-block; padding: 2px 10px; border-radius: 6px;'
-                    f' background: {style["badge_bg"]}; color: {style["badge_text"]};'
-                    f' font-size: 0.78rem; font-weight: 600; margin-right: 8px;">'
-                    f'{style["label"]}</span>'
-                )
                 st.markdown(
-                    f'<div style="font-size: 0.95rem; font-weight: 600; padding: 0.4rem 0;">'
-                    f"{badge_html}"
-                    f'{node.database}.<span style="color: {style["border"]};">{node.name}</span>'
-                    f"</div>",
+                    _SELECTED_HTML.format(
+                        database=node.database, name=node.name, **style
+                    ),
                     unsafe_allow_html=True,
                 )
             else:
-                st.markdown(
-                    '<div style="font-size: 0.95rem; padding: 0.4rem 0; color: #A4ABBA;">Click a node to highlight its connections</div>',
-                    unsafe_allow_html=True,
-                )
+                st.markdown(_HINT_HTML, unsafe_allow_html=True)
         with toolbar_right:
-            clear_disabled = not bool(selected_id and selected_id in lineage.nodes)
             if st.button(
                 "Clear highlight",
                 key="clear_highlight",
                 type="secondary",
                 use_container_width=True,
-                disabled=clear_disabled,
+                disabled=node is None,
             ):
                 st.session_state.pop("lineage_highlight", None)
-                st.session_state["_lineage_skip_result"] = True
                 st.rerun()
 
         # Two-column layout: graph + side panel
         graph_col, panel_col = st.columns([3, 1])
 
         with graph_col:
-            selected_id = render_lineage_graph(lineage, error_views=error_views)
+            selected_id = render_lineage_graph(
+                lineage, error_views=error_views, computed_positions=positions
+            )
 
         with panel_col:
-            if selected_id and selected_id in lineage.nodes:
-                node = lineage.nodes[selected_id]
-
-                ddl_type = (
-                    "MATERIALIZED VIEW" if selected_id in lineage.mv_names else "TABLE"
-                )
+            node = lineage.nodes.get(selected_id) if selected_id is not None else None
+            if selected_id is not None and node is not None:
+                is_mv = selected_id in lineage.mv_names
+                ddl_type = "MATERIALIZED VIEW" if is_mv else "TABLE"
 
                 panel_engine = _resolve_engine(selected_id, lineage)
                 panel_style = _NODE_STYLES.get(panel_engine, _NODE_STYLES["source"])
                 st.markdown(
-                    f'<div style="font-size: 0.95rem; font-weight: 600; padding: 0.3rem 0 0.5rem;">'
-                    f'<span style="display: inline-block; padding: 2px 10px; border-radius: 6px;'
-                    f' background: {panel_style["badge_bg"]}; color: {panel_style["badge_text"]};'
-                    f' font-size: 0.78rem; font-weight: 600; margin-right: 6px;">'
-                    f'{panel_style["label"]}</span>'
-                    f"{node.name}</div>",
+                    _PANEL_HEADER_HTML.format(name=node.name, **panel_style),
                     unsafe_allow_html=True,
                 )
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric("Database", node.database)
-                with col2:
-                    st.metric("Engine", node.engine)
+                st.markdown(
+                    f"**Database:** `{node.database}`  \n**Engine:** `{node.engine}`"
+                )
 
                 st.markdown("---")
 
+                load_create = load_create_view if is_mv else load_create_table
                 try:
-                    if selected_id in lineage.mv_names:
-                        create_sql = load_create_view(node.database, node.name)
-                    else:
-                        create_sql = load_create_table(node.database, node.name)
+                    create_sql = load_create(node.database, node.name)
                 except Exception as e:
-                    if selected_id in lineage.mv_names:
-                        create_sql = f"-- Unable to fetch CREATE MATERIALIZED VIEW: {e}"
-                    else:
-                        create_sql = f"-- Unable to fetch CREATE TABLE: {e}"
+                    create_sql = f"-- Unable to fetch CREATE {ddl_type}: {e}"
+
+                try:
+                    storage_df = load_storage_detail(node.database, node.name)
+                except Exception:
+                    storage_df = pd.DataFrame()
 
                 render_node_detail_sidebar(
                     node.database, node.name, storage_df, create_sql, ddl_type
@@ -2,15 +2,21 @@
 
 from typing import Optional
 
+import pandas as pd
 import streamlit as st
 
 from chview.components.alerts import render_kafka_consumers, render_mv_errors_table
 from chview.components.charts import render_throughput_charts
 from chview.components.tables import render_metrics_cards
+from chview.core.models import ThroughputTotals
+
+# Set by each full page run; consumed by the chart fragment on the same run
+_THROUGHPUT_FRESH_KEY = "_throughput_fresh"
 
 
 def render_metrics_page(
     load_throughput,
+    load_throughput_totals,
     load_mv_errors,
     load_kafka_consumers,
     database: Optional[str] = None,
@@ -19,18 +25,20 @@ def render_metrics_page(
 
     Args:
         load_throughput: Cached MV throughput loader
+        load_throughput_totals: Cached MV throughput totals loader
         load_mv_errors: Cached MV errors loader
         load_kafka_consumers: Cached Kafka consumers loader
-        database: Currently selected database filter
+        database: Currently selected database filter (None for all)
     """
     st.header("Metrics")
 
-    if database and database != "All":
+    if database:
         st.caption(f"Database: **{database}**")
 
     try:
         with st.spinner("Loading throughput data..."):
             throughput_df = load_throughput(database=database)
+        st.session_state[_THROUGHPUT_FRESH_KEY] = True
 
         if throughput_df is None or throughput_df.empty:
             st.info(
@@ -39,11 +47,21 @@ def render_metrics_page(
             )
             return
 
-        render_metrics_cards(throughput_df)
+        try:
+            totals = load_throughput_totals(database=database)
+        except Exception:
+            # The charts below still render from the interval data, so the
+            # cards fall back to totals over that instead of going blank
+            totals = _totals_from_throughput(throughput_df)
+        render_metrics_cards(totals)
         st.divider()
 
-        mv_names = sorted(throughput_df["view_name"].unique())
-        options = ["All"] + list(mv_names)
+        view_names = throughput_df["view_name"]
+        if isinstance(view_names.dtype, pd.CategoricalDtype):
+            mv_names = view_names.cat.categories.tolist()  # already sorted
+        else:
+            mv_names = sorted(view_names.unique())
+        options = ["All"] + mv_names
         selected_mv = st.selectbox("Filter by Materialized View", options)
 
         tab_charts, tab_errors, tab_kafka = st.tabs(["Charts", "Errors", "Kafka"])
@@ -81,12 +99,36 @@ def _render_charts_fragment(
     load_throughput,
     database: Optional[str] = None,
 ) -> None:
-    """Auto-refreshing chart fragment. Re-fetches throughput data every 5 minutes."""
+    """Auto-refreshing chart fragment. Re-fetches throughput data every 5 minutes.
+
+    On a full page run the page has just loaded *throughput_df*, so only the
+    fragment's own timed reruns go back to the loader.
+    """
+    slot = st.empty()
+    if st.session_state.pop(_THROUGHPUT_FRESH_KEY, False):
+        render_throughput_charts(throughput_df, selected_mv, slot=slot)
+        return
     try:
         fresh_df = load_throughput(database=database)
         if fresh_df is not None and not fresh_df.empty:
-            render_throughput_charts(fresh_df, selected_mv)
+            render_throughput_charts(fresh_df, selected_mv, slot=slot)
         else:
-            render_throughput_charts(throughput_df, selected_mv)
+            render_throughput_charts(throughput_df, selected_mv, slot=slot)
     except Exception:
-        render_throughput_charts(throughput_df, selected_mv)
+        render_throughput_charts(throughput_df, selected_mv, slot=slot)
+
+
+def _totals_from_throughput(throughput_df: pd.DataFrame) -> ThroughputTotals:
+    """Aggregate per-interval throughput rows into window totals.
+
+    The interval averages are weighted by their executions, so the result
+    is the same per-execution average the server-side totals report.
+    """
+    executions = throughput_df["executions"]
+    total_exec = int(executions.sum())
+    weighted = (throughput_df["avg_duration_ms"] * executions).sum()
+    return {
+        "executions": total_exec,
+        "rows_written": int(throughput_df["rows_written"].sum()),
+        "avg_duration_ms": float(weighted / total_exec) if total_exec else float("nan"),
+    }
@@ -6,13 +6,12 @@ import pandas as pd
 import streamlit as st
 
 from chview.components.charts import render_storage_treemap
-from chview.components.tables import render_table_detail
-from chview.core.formatters import format_bytes, format_number
+from chview.components.tables import render_schema_table, render_table_detail
 
 
 def render_tables_page(
     schema_df: Optional[pd.DataFrame],
-    load_storage_metrics,
+    load_storage_detail,
     load_partition_storage,
     database: Optional[str] = None,
 ) -> None:
@@ -20,13 +19,13 @@ def render_tables_page(
 
     Args:
         schema_df: Pre-loaded schema DataFrame
-        load_storage_metrics: Cached storage metrics loader
+        load_storage_detail: Cached single-table storage metrics loader
         load_partition_storage: Cached partition storage loader
-        database: Currently selected database filter
+        database: Currently selected database filter (None for all)
     """
     st.header("Tables")
 
-    if database and database != "All":
+    if database:
         st.caption(f"Database: **{database}**")
 
     if schema_df is None or schema_df.empty:
@@ -36,37 +35,35 @@ def render_tables_page(
     tab_list, tab_treemap = st.tabs(["Table List", "Storage Treemap"])
 
     with tab_list:
-        display_df = schema_df[
-            ["database", "name", "engine", "total_rows", "total_bytes"]
-        ].copy()
-        display_df["total_rows"] = display_df["total_rows"].apply(format_number)
-        display_df["total_bytes"] = display_df["total_bytes"].apply(format_bytes)
-        display_df.columns = ["Database", "Name", "Engine", "Rows", "Size"]
-        st.dataframe(display_df, use_container_width=True, hide_index=True)
+        render_schema_table(schema_df)
 
         st.divider()
 
         # Detail selectbox — pre-select from sidebar click
-        table_options = [
-            f"{row['database']}.{row['name']}" for _, row in schema_df.iterrows()
-        ]
+        # Options are row positions labelled "db.table", so the choice maps
+        # straight back to its (database, table) pair without re-parsing
+        databases = schema_df["database"].astype(str)
+        names = schema_df["name"].astype(str)
+        table_pairs = list(zip(databases, names))
+        table_labels = (databases + "." + names).tolist()
         sel = st.session_state.get("selected_table")
         default_idx = 0
         if sel:
-            full_name = f"{sel[0]}.{sel[1]}"
-            if full_name in table_options:
-                default_idx = table_options.index(full_name)
+            pair_index = {pair: i for i, pair in enumerate(table_pairs)}
+            default_idx = pair_index.get((sel[0], sel[1]), 0)
 
         chosen = st.selectbox(
-            "Select table for details", table_options, index=default_idx
+            "Select table for details",
+            range(len(table_pairs)),
+            index=default_idx,
+            format_func=table_labels.__getitem__,
         )
 
-        if chosen:
-            parts = chosen.split(".", 1)
-            tbl_database, tbl_table = parts[0], parts[1]
+        if chosen is not None:
+            tbl_database, tbl_table = table_pairs[chosen]
             try:
                 with st.spinner("Loading storage metrics..."):
-                    storage_df = load_storage_metrics(database=tbl_database)
+                    storage_df = load_storage_detail(tbl_database, tbl_table)
                 render_table_detail(tbl_database, tbl_table, storage_df)
             except Exception as e:
                 st.error(f"Failed to load table detail: {e}")
@@ -1,12 +1,29 @@
-"""Shared pytest fixtures for CHView test suite."""
+"""Shared pytest fixtures for CHView test suite.
+
+Fixtures are session-scoped and shared by every test that requests them, so
+tests must treat them as read-only (copy before mutating). The hand-built
+lineage graphs are frozen to enforce this.
+"""
+
+from types import MappingProxyType
 
 import pandas as pd
 import pytest
 
-from chview.lineage.graph import LineageEdge, LineageGraph, TableNode
+from chview.lineage.graph import LineageEdge, LineageGraph, TableNode, build_lineage
+
+
+def _freeze(graph: LineageGraph) -> LineageGraph:
+    """Return a read-only view of *graph* for sharing across tests."""
+    return LineageGraph(
+        nodes=MappingProxyType(graph.nodes),  # type: ignore[arg-type]
+        edges=tuple(graph.edges),  # type: ignore[arg-type]
+        mv_names=frozenset(graph.mv_names),  # type: ignore[arg-type]
+        target_names=frozenset(graph.target_names),  # type: ignore[arg-type]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_mv_df() -> pd.DataFrame:
     """Minimal MV DataFrame: one MV with a TO clause."""
     return pd.DataFrame(
@@ -26,7 +43,19 @@ def simple_mv_df() -> pd.DataFrame:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def simple_lineage(simple_mv_df: pd.DataFrame) -> LineageGraph:
+    """Lineage built from ``simple_mv_df`` without schema info."""
+    return build_lineage(simple_mv_df)
+
+
+@pytest.fixture(scope="session")
+def simple_edge_pairs(simple_lineage: LineageGraph) -> set[tuple[str, str]]:
+    """(source, target) pairs of every edge in ``simple_lineage``."""
+    return {(e.source, e.target) for e in simple_lineage.edges}
+
+
+@pytest.fixture(scope="session")
 def multi_mv_df() -> pd.DataFrame:
     """Two chained MVs: raw → mv_a → mv_b."""
     return pd.DataFrame(
@@ -55,7 +84,7 @@ def multi_mv_df() -> pd.DataFrame:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def schema_df() -> pd.DataFrame:
     """Small schema DataFrame covering tables used in fixtures above."""
     return pd.DataFrame(
@@ -69,7 +98,7 @@ def schema_df() -> pd.DataFrame:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def linear_lineage() -> LineageGraph:
     """A -> MV -> B linear graph (3 nodes, 2 edges)."""
     nodes = {
@@ -84,10 +113,10 @@ def linear_lineage() -> LineageGraph:
     graph = LineageGraph(nodes=nodes, edges=edges)
     graph.mv_names.add("db.MV")
     graph.target_names.add("db.B")
-    return graph
+    return _freeze(graph)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def diamond_lineage() -> LineageGraph:
     """
     Diamond pattern:
@@ -110,4 +139,4 @@ def diamond_lineage() -> LineageGraph:
     graph = LineageGraph(nodes=nodes, edges=edges)
     graph.mv_names.update({"db.MV1", "db.MV2"})
     graph.target_names.add("db.C")
-    return graph
+    return _freeze(graph)
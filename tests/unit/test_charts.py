@@ -0,0 +1,122 @@
+"""Unit tests for chview.components.charts helpers."""
+
+import pandas as pd
+
+from chview.components.charts import (
+    _aggregate_by_time,
+    _collapse_tail_partitions,
+    _filter_view,
+    _treemap_figure,
+)
+
+
+class TestAggregateByTime:
+    def test_matches_groupby(self) -> None:
+        df = pd.DataFrame(
+            {
+                "view_name": ["db.a", "db.a", "db.b", "db.b"],
+                "interval_start": pd.to_datetime(
+                    ["2024-01-01 00:05", "2024-01-01 00:00"] * 2
+                ),
+                "rows_written": [1, 2, 10, 20],
+                "rows_read": [3, 4, 30, 40],
+                "avg_duration_ms": [1.0, 2.0, 3.0, 6.0],
+            }
+        )
+        result = _aggregate_by_time(df, "interval_start")
+        expected = df.groupby("interval_start", as_index=False).agg(
+            rows_written=("rows_written", "sum"),
+            rows_read=("rows_read", "sum"),
+            avg_duration_ms=("avg_duration_ms", "mean"),
+        )
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    def test_nan_duration_ignored(self) -> None:
+        df = pd.DataFrame(
+            {
+                "hour": [1, 1],
+                "rows_written": [1, 1],
+                "rows_read": [0, 0],
+                "avg_duration_ms": [float("nan"), 4.0],
+            }
+        )
+        result = _aggregate_by_time(df, "hour")
+        assert result["avg_duration_ms"].tolist() == [4.0]
+
+
+class TestCollapseTailPartitions:
+    def test_small_tables_unchanged(self) -> None:
+        df = pd.DataFrame(
+            {
+                "database": ["db"],
+                "table": ["t"],
+                "partition": ["p1"],
+                "rows": [1],
+                "bytes_on_disk": [10],
+                "compressed_bytes": [5],
+            }
+        )
+        assert _collapse_tail_partitions(df, 20) is df
+
+    def test_tail_folded_into_others(self) -> None:
+        df = pd.DataFrame(
+            {
+                "database": ["db"] * 3,
+                "table": ["t"] * 3,
+                "partition": ["p1", "p2", "p3"],
+                "rows": [1, 2, 3],
+                "bytes_on_disk": [30, 20, 10],
+                "compressed_bytes": [3, 2, 1],
+            }
+        )
+        result = _collapse_tail_partitions(df, 1)
+        assert result["partition"].tolist() == ["p1", "(others)"]
+        others = result[result["partition"] == "(others)"].iloc[0]
+        assert others["bytes_on_disk"] == 30
+        assert others["rows"] == 5
+
+    def test_categorical_keys_add_no_empty_groups(self) -> None:
+        df = pd.DataFrame(
+            {
+                "database": ["a", "a", "b"],
+                "table": ["t1", "t1", "t2"],
+                "partition": ["p1", "p2", "p1"],
+                "rows": [1, 2, 3],
+                "bytes_on_disk": [30, 20, 10],
+                "compressed_bytes": [3, 2, 1],
+            }
+        ).astype({"database": "category", "table": "category"})
+        result = _collapse_tail_partitions(df, 1)
+        assert len(result) == 3
+        assert (result["bytes_on_disk"] > 0).all()
+
+
+class TestTreemapFigure:
+    def test_hover_values_use_display_formatters(self) -> None:
+        df = pd.DataFrame(
+            {
+                "database": ["db"],
+                "table": ["t"],
+                "partition": ["p1"],
+                "rows": [1234.0],
+                "bytes_on_disk": [10],
+                "compressed_bytes": [2048.0],
+            }
+        )
+        fig = _treemap_figure(df)
+        assert fig is not None
+        assert fig.data[0].customdata[0].tolist()[:2] == ["1.2K", "2.0 KB"]
+
+
+class TestFilterView:
+    def test_categorical_matches_object(self) -> None:
+        df = pd.DataFrame({"view_name": ["db.a", "db.b", "db.a"], "rows": [1, 2, 3]})
+        categorical = df.astype({"view_name": "category"})
+        assert _filter_view(df, "db.a")["rows"].tolist() == [1, 3]
+        assert _filter_view(categorical, "db.a")["rows"].tolist() == [1, 3]
+
+    def test_unknown_view_is_empty(self) -> None:
+        df = pd.DataFrame({"view_name": ["db.a"], "rows": [1]}).astype(
+            {"view_name": "category"}
+        )
+        assert _filter_view(df, "db.missing").empty
@@ -1,12 +1,33 @@
 """Unit tests for chview.core.formatters."""
 
+import pytest
+
 from chview.core.formatters import (
     format_bytes,
+    format_bytes_array,
     format_duration_ms,
     format_number,
+    format_number_array,
     format_timestamp_ago,
 )
 
+_ARRAY_VALUES = [
+    None,
+    float("nan"),
+    0,
+    42,
+    -50,
+    999.6,
+    1_000,
+    1_024,
+    -1_500,
+    1536 * 1024,
+    999_960,
+    5_600_000_000,
+    1024**4,
+    1e18,
+]
+
 
 class TestFormatNumber:
     def test_none_returns_dash(self) -> None:
@@ -46,6 +67,10 @@ class TestFormatNumber:
     def test_zero(self) -> None:
         assert format_number(0) == "0"
 
+    @pytest.mark.parametrize("n", [-1_001, -999, 0, 999, 1_000, 1_001])
+    def test_int_matches_float(self, n: int) -> None:
+        assert format_number(n) == format_number(float(n))
+
 
 class TestFormatBytes:
     def test_none_returns_dash(self) -> None:
@@ -76,6 +101,10 @@ class TestFormatBytes:
     def test_zero(self) -> None:
         assert format_bytes(0) == "0.0 B"
 
+    @pytest.mark.parametrize("n", [-1_025, -1_023, 0, 1_023, 1_024, 1_025])
+    def test_int_matches_float(self, n: int) -> None:
+        assert format_bytes(n) == format_bytes(float(n))
+
 
 class TestFormatDurationMs:
     def test_none_returns_na(self) -> None:
@@ -128,3 +157,17 @@ class TestFormatTimestampAgo:
 
     def test_zero(self) -> None:
         assert format_timestamp_ago(0) == "0s ago"
+
+
+class TestArrayFormatters:
+    @pytest.mark.parametrize(
+        ("array_fn", "scalar_fn"),
+        [(format_number_array, format_number), (format_bytes_array, format_bytes)],
+    )
+    def test_matches_scalar(self, array_fn, scalar_fn) -> None:
+        result = array_fn(_ARRAY_VALUES)
+        assert list(result) == [scalar_fn(v) for v in _ARRAY_VALUES]
+
+    def test_empty(self) -> None:
+        assert len(format_number_array([])) == 0
+        assert len(format_bytes_array([])) == 0
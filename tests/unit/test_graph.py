@@ -1,8 +1,12 @@
 """Unit tests for chview.lineage.graph."""
 
+import dataclasses
+import sys
+
 import pandas as pd
+import pytest
 
-from chview.lineage.graph import LineageEdge, TableNode, build_lineage
+from chview.lineage.graph import LineageEdge, LineageGraph, TableNode, build_lineage
 
 
 class TestTableNode:
@@ -18,6 +22,25 @@ class TestTableNode:
         node = TableNode("db", "t", "SummingMergeTree")
         assert node.engine == "SummingMergeTree"
 
+    def test_display_name_short_kept(self) -> None:
+        node = TableNode("db", "events", "MergeTree")
+        assert node.display_name == "events"
+
+    def test_display_name_long_truncated(self) -> None:
+        node = TableNode("db", "x" * 40, "MergeTree")
+        assert node.display_name == "x" * 32 + "..."
+        assert len(node.display_name) == 35
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots needs 3.10+")
+    def test_is_slotted(self) -> None:
+        assert not hasattr(TableNode("a", "b", "c"), "__dict__")
+
+    def test_is_frozen_and_hashable(self) -> None:
+        node = TableNode("db", "t", "MergeTree")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            node.engine = "Log"  # type: ignore[misc]
+        assert {node: 1}[TableNode("db", "t", "MergeTree")] == 1
+
 
 class TestLineageEdge:
     def test_fields(self) -> None:
@@ -28,36 +51,27 @@ class TestLineageEdge:
 
 
 class TestBuildLineage:
-    def test_mv_added_as_node(self, simple_mv_df: pd.DataFrame) -> None:
-        lineage = build_lineage(simple_mv_df)
-        assert "mydb.mv_orders" in lineage.nodes
-        assert lineage.nodes["mydb.mv_orders"].engine == "MaterializedView"
+    def test_mv_added_as_node(self, simple_lineage: LineageGraph) -> None:
+        assert "mydb.mv_orders" in simple_lineage.nodes
+        assert simple_lineage.nodes["mydb.mv_orders"].engine == "MaterializedView"
 
-    def test_mv_in_mv_names(self, simple_mv_df: pd.DataFrame) -> None:
-        lineage = build_lineage(simple_mv_df)
-        assert "mydb.mv_orders" in lineage.mv_names
+    def test_mv_in_mv_names(self, simple_lineage: LineageGraph) -> None:
+        assert "mydb.mv_orders" in simple_lineage.mv_names
 
-    def test_source_table_added(self, simple_mv_df: pd.DataFrame) -> None:
-        lineage = build_lineage(simple_mv_df)
-        assert "mydb.orders" in lineage.nodes
+    def test_source_table_added(self, simple_lineage: LineageGraph) -> None:
+        assert "mydb.orders" in simple_lineage.nodes
 
-    def test_target_table_added(self, simple_mv_df: pd.DataFrame) -> None:
-        lineage = build_lineage(simple_mv_df)
-        assert "mydb.orders_agg" in lineage.nodes
+    def test_target_table_added(self, simple_lineage: LineageGraph) -> None:
+        assert "mydb.orders_agg" in simple_lineage.nodes
 
-    def test_target_in_target_names(self, simple_mv_df: pd.DataFrame) -> None:
-        lineage = build_lineage(simple_mv_df)
-        assert "mydb.orders_agg" in lineage.target_names
+    def test_target_in_target_names(self, simple_lineage: LineageGraph) -> None:
+        assert "mydb.orders_agg" in simple_lineage.target_names
 
-    def test_edges_source_to_mv(self, simple_mv_df: pd.DataFrame) -> None:
-        lineage = build_lineage(simple_mv_df)
-        edge_sources = {(e.source, e.target) for e in lineage.edges}
-        assert ("mydb.orders", "mydb.mv_orders") in edge_sources
+    def test_edges_source_to_mv(self, simple_edge_pairs: set[tuple[str, str]]) -> None:
+        assert ("mydb.orders", "mydb.mv_orders") in simple_edge_pairs
 
-    def test_edges_mv_to_target(self, simple_mv_df: pd.DataFrame) -> None:
-        lineage = build_lineage(simple_mv_df)
-        edge_sources = {(e.source, e.target) for e in lineage.edges}
-        assert ("mydb.mv_orders", "mydb.orders_agg") in edge_sources
+    def test_edges_mv_to_target(self, simple_edge_pairs: set[tuple[str, str]]) -> None:
+        assert ("mydb.mv_orders", "mydb.orders_agg") in simple_edge_pairs
 
     def test_engine_lookup_from_schema(
         self, simple_mv_df: pd.DataFrame, schema_df: pd.DataFrame
@@ -66,6 +80,13 @@ class TestBuildLineage:
         # The target table should get the engine from schema
         assert lineage.nodes["mydb.orders_agg"].engine == "SummingMergeTree"
 
+    def test_engine_lookup_from_categorical_schema(
+        self, simple_mv_df: pd.DataFrame, schema_df: pd.DataFrame
+    ) -> None:
+        categorical = schema_df.astype({"database": "category", "engine": "category"})
+        expected = build_lineage(simple_mv_df, schema_df).nodes
+        assert build_lineage(simple_mv_df, categorical).nodes == expected
+
     def test_chained_mvs(
         self, multi_mv_df: pd.DataFrame, schema_df: pd.DataFrame
     ) -> None:
@@ -108,5 +129,4 @@ class TestBuildLineage:
             ]
         )
         lineage = build_lineage(df)
-        node_ids = set(lineage.nodes.keys())
-        assert "db.extra" in node_ids
+        assert "db.extra" in lineage.nodes
@@ -1,31 +1,67 @@
 """Unit tests for chview.lineage.layout."""
 
+import numpy as np
 import pytest
 
 from chview.lineage.graph import LineageEdge, LineageGraph, TableNode
 from chview.lineage.layout import calculate_positions, get_connected_subgraph
 
+Positions = dict[str, tuple[float, float]]
+ConnectedSets = dict[str, frozenset[str]]
+
+
+def _xs_in_order(positions: Positions, order: list[str]) -> np.ndarray:
+    """Return the x coordinates of *order*'s nodes as one array."""
+    return np.array([positions[node_id][0] for node_id in order])
+
+
+@pytest.fixture(scope="module")
+def linear_positions(linear_lineage: LineageGraph) -> Positions:
+    """Layout of ``linear_lineage``, computed once for the module."""
+    return calculate_positions(linear_lineage)
+
+
+@pytest.fixture(scope="module")
+def linear_connected(linear_lineage: LineageGraph) -> ConnectedSets:
+    """Connected subgraph of ``linear_lineage`` from every seed node."""
+    return {
+        node_id: frozenset(get_connected_subgraph(linear_lineage, node_id))
+        for node_id in linear_lineage.nodes
+    }
+
+
+@pytest.fixture(scope="module")
+def diamond_connected(diamond_lineage: LineageGraph) -> ConnectedSets:
+    """Connected subgraph of ``diamond_lineage`` from every seed node."""
+    return {
+        node_id: frozenset(get_connected_subgraph(diamond_lineage, node_id))
+        for node_id in diamond_lineage.nodes
+    }
+
+
+@pytest.fixture(scope="module")
+def diamond_positions(diamond_lineage: LineageGraph) -> Positions:
+    """Layout of ``diamond_lineage``, computed once for the module."""
+    return calculate_positions(diamond_lineage)
+
 
 class TestCalculatePositions:
-    def test_all_nodes_get_positions(self, linear_lineage: LineageGraph) -> None:
-        positions = calculate_positions(linear_lineage)
-        assert set(positions.keys()) == set(linear_lineage.nodes.keys())
+    def test_all_nodes_get_positions(
+        self, linear_lineage: LineageGraph, linear_positions: Positions
+    ) -> None:
+        assert linear_positions.keys() == linear_lineage.nodes.keys()
 
-    def test_positions_are_tuples_of_floats(self, linear_lineage: LineageGraph) -> None:
-        positions = calculate_positions(linear_lineage)
-        for pos in positions.values():
+    def test_positions_are_tuples_of_floats(self, linear_positions: Positions) -> None:
+        for pos in linear_positions.values():
             assert len(pos) == 2
             assert isinstance(pos[0], float)
             assert isinstance(pos[1], float)
 
-    def test_source_is_level_zero(self, linear_lineage: LineageGraph) -> None:
+    def test_source_is_level_zero(self, linear_positions: Positions) -> None:
         """db.A has no incoming edges → level 0 → lowest x."""
-        positions = calculate_positions(linear_lineage)
-        x_a = positions["db.A"][0]
-        x_mv = positions["db.MV"][0]
-        x_b = positions["db.B"][0]
+        xs = _xs_in_order(linear_positions, ["db.A", "db.MV", "db.B"])
         # Levels should be strictly increasing left-to-right
-        assert x_a < x_mv < x_b
+        assert (np.diff(xs) > 0).all()
 
     def test_empty_graph(self) -> None:
         lineage = LineageGraph()
@@ -40,9 +76,16 @@ class TestCalculatePositions:
         positions = calculate_positions(lineage)
         assert "db.X" in positions
 
-    def test_diamond_all_positioned(self, diamond_lineage: LineageGraph) -> None:
-        positions = calculate_positions(diamond_lineage)
-        assert set(positions.keys()) == set(diamond_lineage.nodes.keys())
+    def test_diamond_all_positioned(
+        self, diamond_lineage: LineageGraph, diamond_positions: Positions
+    ) -> None:
+        assert diamond_positions.keys() == diamond_lineage.nodes.keys()
+
+    def test_diamond_sink_at_longest_path_level(
+        self, diamond_positions: Positions
+    ) -> None:
+        x = {node_id: pos[0] for node_id, pos in diamond_positions.items()}
+        assert x["db.C"] > x["db.MV1"] > x["db.A"]
 
     def test_cycle_does_not_raise(self) -> None:
         """Cyclic graph must not cause infinite recursion."""
@@ -58,23 +101,33 @@ class TestCalculatePositions:
         positions = calculate_positions(lineage)  # should not raise
         assert len(positions) == 2
 
-    def test_x_spacing_between_levels(self, linear_lineage: LineageGraph) -> None:
-        """Adjacent levels must be exactly x_spacing (320) apart."""
-        positions = calculate_positions(linear_lineage)
-        x_diff = positions["db.MV"][0] - positions["db.A"][0]
-        assert x_diff == pytest.approx(380.0)
+    def test_deep_chain_does_not_recurse(self) -> None:
+        """Chains deeper than the recursion limit must still be levelled."""
+        depth = 5000
+        nodes = {
+            f"db.T{i}": TableNode("db", f"T{i}", "MergeTree") for i in range(depth)
+        }
+        edges = [
+            LineageEdge(f"db.T{i}", f"db.T{i + 1}", "mv") for i in range(depth - 1)
+        ]
+        positions = calculate_positions(LineageGraph(nodes=nodes, edges=edges))
+        xs = _xs_in_order(positions, list(nodes))
+        assert (np.diff(xs) == 380.0).all()
+
+    def test_x_spacing_between_levels(self, linear_positions: Positions) -> None:
+        """Adjacent levels must be exactly x_spacing (380) apart."""
+        x_diff = linear_positions["db.MV"][0] - linear_positions["db.A"][0]
+        assert x_diff == 380.0
 
 
 class TestGetConnectedSubgraph:
     def test_returns_all_nodes_in_linear_chain(
-        self, linear_lineage: LineageGraph
+        self, linear_connected: ConnectedSets
     ) -> None:
-        connected = get_connected_subgraph(linear_lineage, "db.MV")
-        assert connected == {"db.A", "db.MV", "db.B"}
+        assert linear_connected["db.MV"] == {"db.A", "db.MV", "db.B"}
 
-    def test_includes_selected_node(self, linear_lineage: LineageGraph) -> None:
-        connected = get_connected_subgraph(linear_lineage, "db.A")
-        assert "db.A" in connected
+    def test_includes_selected_node(self, linear_connected: ConnectedSets) -> None:
+        assert all(seed in connected for seed, connected in linear_connected.items())
 
     def test_isolated_node(self) -> None:
         lineage = LineageGraph(
@@ -87,22 +140,24 @@ class TestGetConnectedSubgraph:
         connected = get_connected_subgraph(lineage, "db.X")
         assert connected == {"db.X"}
 
-    def test_source_node_reaches_downstream(self, linear_lineage: LineageGraph) -> None:
-        connected = get_connected_subgraph(linear_lineage, "db.A")
-        assert "db.B" in connected
+    def test_source_node_reaches_downstream(
+        self, linear_connected: ConnectedSets
+    ) -> None:
+        assert "db.B" in linear_connected["db.A"]
 
-    def test_target_node_reaches_upstream(self, linear_lineage: LineageGraph) -> None:
-        connected = get_connected_subgraph(linear_lineage, "db.B")
-        assert "db.A" in connected
+    def test_target_node_reaches_upstream(
+        self, linear_connected: ConnectedSets
+    ) -> None:
+        assert "db.A" in linear_connected["db.B"]
 
-    def test_diamond_from_source(self, diamond_lineage: LineageGraph) -> None:
-        connected = get_connected_subgraph(diamond_lineage, "db.A")
+    def test_diamond_from_source(self, diamond_connected: ConnectedSets) -> None:
+        connected = diamond_connected["db.A"]
         # All nodes reachable from db.A downstream
         assert "db.MV1" in connected
         assert "db.C" in connected
 
-    def test_diamond_from_sink(self, diamond_lineage: LineageGraph) -> None:
-        connected = get_connected_subgraph(diamond_lineage, "db.C")
+    def test_diamond_from_sink(self, diamond_connected: ConnectedSets) -> None:
+        connected = diamond_connected["db.C"]
         # Both upstream paths reachable
         assert "db.A" in connected
         assert "db.B" in connected
@@ -1,40 +1,53 @@
 """Unit tests for chview.lineage.parser."""
 
+import pytest
+
 from chview.lineage.parser import (
     _qualify_table_name,
+    _regex_source_tables,
     parse_source_tables,
     parse_target_table,
 )
 
 
 class TestQualifyTableName:
-    def test_already_qualified(self) -> None:
-        assert _qualify_table_name("mydb.mytable", "other") == "mydb.mytable"
-
-    def test_unqualified_adds_default(self) -> None:
-        assert _qualify_table_name("mytable", "mydb") == "mydb.mytable"
-
-    def test_strips_backticks(self) -> None:
-        assert _qualify_table_name("`mydb`.`mytable`", "other") == "mydb.mytable"
-
-    def test_strips_surrounding_whitespace(self) -> None:
-        assert _qualify_table_name("  mytable  ", "mydb") == "mydb.mytable"
-
-    def test_backtick_qualified(self) -> None:
-        result = _qualify_table_name("`mydb`.`t`", "fallback")
-        assert result == "mydb.t"
+    @pytest.mark.parametrize(
+        ("table_ref", "default_database", "expected"),
+        [
+            ("mydb.mytable", "other", "mydb.mytable"),
+            ("mytable", "mydb", "mydb.mytable"),
+            ("`mydb`.`mytable`", "other", "mydb.mytable"),
+            ("  mytable  ", "mydb", "mydb.mytable"),
+            ("`mydb`.`t`", "fallback", "mydb.t"),
+        ],
+        ids=[
+            "already_qualified",
+            "unqualified_adds_default",
+            "strips_backticks",
+            "strips_surrounding_whitespace",
+            "backtick_qualified",
+        ],
+    )
+    def test_qualify(
+        self, table_ref: str, default_database: str, expected: str
+    ) -> None:
+        assert _qualify_table_name(table_ref, default_database) == expected
 
 
 class TestParseSourceTables:
-    def test_simple_from(self) -> None:
-        sql = "CREATE MATERIALIZED VIEW db.mv TO db.out AS SELECT id FROM db.events"
-        sources = parse_source_tables(sql, "db")
-        assert "db.events" in sources
-
-    def test_qualified_from(self) -> None:
-        sql = "CREATE MATERIALIZED VIEW db.mv TO db.out AS SELECT id FROM other.events"
-        sources = parse_source_tables(sql, "db")
-        assert "other.events" in sources
+    @pytest.mark.parametrize(
+        ("select", "expected"),
+        [
+            ("AS SELECT id FROM db.events", "db.events"),
+            ("AS SELECT id FROM other.events", "other.events"),
+            ("AS SELECT id FROM raw_events", "db.raw_events"),
+            ("as select id from db.tbl", "db.tbl"),
+        ],
+        ids=["simple", "qualified", "unqualified_uses_mv_db", "case_insensitive"],
+    )
+    def test_single_source(self, select: str, expected: str) -> None:
+        sql = f"CREATE MATERIALIZED VIEW db.mv TO db.out {select}"
+        assert expected in parse_source_tables(sql, "db")
 
     def test_join(self) -> None:
         sql = (
@@ -47,21 +60,14 @@ class TestParseSourceTables:
 
     def test_no_select_returns_empty(self) -> None:
         sql = "CREATE TABLE db.foo (id UInt64) ENGINE = MergeTree()"
-        sources = parse_source_tables(sql, "db")
-        assert sources == []
+        assert parse_source_tables(sql, "db") == ()
 
-    def test_unqualified_table_qualified_with_mv_db(self) -> None:
-        sql = "CREATE MATERIALIZED VIEW db.mv TO db.out AS SELECT id FROM raw_events"
-        sources = parse_source_tables(sql, "db")
-        assert "db.raw_events" in sources
-
-    def test_returns_sorted_list(self) -> None:
+    def test_returns_sorted_tuple(self) -> None:
         sql = (
             "CREATE MATERIALIZED VIEW db.mv TO db.out AS "
             "SELECT id FROM db.zzz JOIN db.aaa ON 1=1"
         )
-        sources = parse_source_tables(sql, "db")
-        assert sources == sorted(sources)
+        assert parse_source_tables(sql, "db") == ("db.aaa", "db.zzz")
 
     def test_deduplicates_same_table(self) -> None:
         sql = (
@@ -71,24 +77,56 @@ class TestParseSourceTables:
         sources = parse_source_tables(sql, "db")
         assert sources.count("db.src") == 1
 
-    def test_case_insensitive_as_select(self) -> None:
-        sql = "CREATE MATERIALIZED VIEW db.mv TO db.out as select id from db.tbl"
-        sources = parse_source_tables(sql, "db")
-        assert "db.tbl" in sources
+    def test_returns_shared_tuple(self) -> None:
+        sql = "CREATE MATERIALIZED VIEW db.mv TO db.out AS SELECT id FROM db.src"
+        assert parse_source_tables(sql, "db") is parse_source_tables(sql, "db")
+
+
+class TestSingleFromFastPath:
+    @pytest.mark.parametrize(
+        "select_part",
+        [
+            "AS SELECT id FROM events",
+            "AS SELECT id FROM db.events WHERE x > 1",
+            "as select id from `my db`.`ev-ents`",
+            "AS SELECT id FROM\n\tevents)",
+            "AS SELECT from_date FROM events",
+            "AS SELECT id, x.fromage FROM events",
+            "AS SELECT id FROM (SELECT id FROM events)",
+            "AS SELECT id FROM a JOIN b ON a.id = b.id",
+            "AS SELECT id FROM a LEFT JOIN db2.b USING id",
+            "AS SELECT 1 FROM(events)",
+            "AS SELECT 1",
+        ],
+    )
+    def test_matches_regex_path(self, select_part: str) -> None:
+        query = f"CREATE MATERIALIZED VIEW db.mv TO db.out {select_part}"
+        assert parse_source_tables(query, "db") == _regex_source_tables(
+            select_part, "db"
+        )
 
 
 class TestParseTargetTable:
-    def test_explicit_to_clause(self) -> None:
-        sql = "CREATE MATERIALIZED VIEW db.mv TO db.output AS SELECT id FROM db.src"
-        target, is_implicit = parse_target_table(sql, "db", "mv")
-        assert target == "db.output"
-        assert is_implicit is False
-
-    def test_qualified_to_clause(self) -> None:
-        sql = "CREATE MATERIALIZED VIEW db.mv TO other.output AS SELECT id FROM db.src"
-        target, is_implicit = parse_target_table(sql, "db", "mv")
-        assert target == "other.output"
-        assert is_implicit is False
+    @pytest.mark.parametrize(
+        ("sql", "expected"),
+        [
+            (
+                "CREATE MATERIALIZED VIEW db.mv TO db.output AS SELECT id FROM db.src",
+                "db.output",
+            ),
+            (
+                "CREATE MATERIALIZED VIEW db.mv TO other.output AS SELECT id FROM db.src",
+                "other.output",
+            ),
+            (
+                "create materialized view db.mv to db.sink as select id from db.src",
+                "db.sink",
+            ),
+        ],
+        ids=["explicit", "qualified", "case_insensitive"],
+    )
+    def test_to_clause(self, sql: str, expected: str) -> None:
+        assert parse_target_table(sql, "db", "mv") == (expected, False)
 
     def test_no_to_clause_returns_implicit(self) -> None:
         sql = "CREATE MATERIALIZED VIEW db.mv AS SELECT id FROM db.src"
@@ -101,9 +139,3 @@ class TestParseTargetTable:
         sql = "CREATE MATERIALIZED VIEW db.mv AS SELECT id FROM db.src"
         target, _ = parse_target_table(sql, "db", "mv")
         assert target.startswith("db.")
-
-    def test_case_insensitive_to(self) -> None:
-        sql = "create materialized view db.mv to db.sink as select id from db.src"
-        target, is_implicit = parse_target_table(sql, "db", "mv")
-        assert target == "db.sink"
-        assert is_implicit is False
@@ -1,6 +1,11 @@
 """Unit tests for chview.db.queries."""
 
+import re
+
+import pytest
+
 from chview.db.queries import (
+    build_cluster_info_query,
     build_database_filter,
     build_kafka_check_query,
     build_kafka_consumers_query,
@@ -9,44 +14,56 @@ from chview.db.queries import (
     build_mv_throughput_query,
     build_partition_storage_query,
     build_recent_throughput_query,
-    build_storage_metrics_query,
+    build_show_create_query,
+    build_storage_detail_query,
     build_system_tables_query,
+    build_throughput_totals_query,
 )
 
+# Both failure statuses, in one IN list, whatever the whitespace
+_EXCEPTION_STATUS_RE = re.compile(
+    r"status\s+IN\s+\(\s*'ExceptionBeforeStart',\s*'ExceptionWhileProcessing'\s*\)"
+)
 
-class TestBuildDatabaseFilter:
-    def test_no_filter_returns_empty(self) -> None:
-        clause, params = build_database_filter(exclude_system=False)
-        assert clause == ""
-        assert params == {}
-
-    def test_exclude_system_default(self) -> None:
-        clause, params = build_database_filter()
-        assert "WHERE" in clause
-        assert "system" in clause
-        assert params == {}
-
-    def test_specific_database(self) -> None:
-        clause, params = build_database_filter(database="mydb")
-        assert "WHERE" in clause
-        assert "%(database)s" in clause
-        assert params == {"database": "mydb"}
-
-    def test_all_database_treated_as_no_filter_with_exclude_system(self) -> None:
-        clause, params = build_database_filter(database="All")
-        # "All" is treated as no specific filter → falls through to exclude_system
-        assert "system" in clause
-        assert "database" not in params
-
-    def test_custom_column_name(self) -> None:
-        clause, params = build_database_filter(column="db", database="foo")
-        assert "db = %(database)s" in clause
-        assert params == {"database": "foo"}
 
-    def test_no_filter_no_exclude(self) -> None:
-        clause, params = build_database_filter(database=None, exclude_system=False)
-        assert clause == ""
-        assert params == {}
+class TestBuildDatabaseFilter:
+    @pytest.mark.parametrize(
+        ("kwargs", "fragments", "expected_params"),
+        [
+            ({"exclude_system": False}, (), {}),
+            ({}, ("WHERE", "system"), {}),
+            ({"database": "mydb"}, ("WHERE", "%(database)s"), {"database": "mydb"}),
+            # "All" is treated as no specific filter → falls through to exclude_system
+            ({"database": "All"}, ("WHERE", "system"), {}),
+            (
+                {"column": "db", "database": "foo"},
+                ("db = %(database)s",),
+                {"database": "foo"},
+            ),
+            ({"database": None, "exclude_system": False}, (), {}),
+        ],
+        ids=[
+            "no_filter_returns_empty",
+            "exclude_system_default",
+            "specific_database",
+            "all_database_excludes_system",
+            "custom_column_name",
+            "no_filter_no_exclude",
+        ],
+    )
+    def test_filter(
+        self, kwargs: dict, fragments: tuple[str, ...], expected_params: dict
+    ) -> None:
+        clause, params = build_database_filter(**kwargs)
+        assert all(fragment in clause for fragment in fragments)
+        assert bool(clause) == bool(fragments)
+        assert params == expected_params
+
+    def test_memoized_params_not_shared(self) -> None:
+        _, params = build_database_filter(database="mydb")
+        params["database"] = "mutated"
+        _, fresh = build_database_filter(database="mydb")
+        assert fresh == {"database": "mydb"}
 
 
 class TestBuildSystemTablesQuery:
@@ -65,6 +82,11 @@ class TestBuildSystemTablesQuery:
         assert "system" in query  # the NOT IN system clause
         assert params == {}
 
+    def test_repeat_call_reuses_query_string(self) -> None:
+        first, _ = build_system_tables_query(database="mydb")
+        second, _ = build_system_tables_query(database="mydb")
+        assert first is second
+
 
 class TestBuildMaterializedViewsQuery:
     def test_always_includes_materialized_view_filter(self) -> None:
@@ -82,20 +104,15 @@ class TestBuildMaterializedViewsQuery:
         assert params == {}
 
 
-class TestBuildStorageMetricsQuery:
-    def test_active_filter_always_present(self) -> None:
-        query, _ = build_storage_metrics_query()
-        assert "active = 1" in query
+class TestBuildStorageDetailQuery:
+    def test_filters_single_table(self) -> None:
+        query, params = build_storage_detail_query("db", "events")
+        assert "%(table)s" in query
+        assert params == {"database": "db", "table": "events"}
 
-    def test_with_database(self) -> None:
-        query, params = build_storage_metrics_query(database="analytics")
-        assert "%(database)s" in query
-        assert params["database"] == "analytics"
-
-    def test_selects_correct_columns(self) -> None:
-        query, _ = build_storage_metrics_query()
-        assert "bytes_on_disk" in query
-        assert "compressed_bytes" in query
+    def test_includes_uncompressed_bytes(self) -> None:
+        query, _ = build_storage_detail_query("db", "events")
+        assert "data_uncompressed_bytes" in query
 
 
 class TestBuildPartitionStorageQuery:
@@ -107,11 +124,28 @@ class TestBuildPartitionStorageQuery:
         query, _ = build_partition_storage_query()
         assert "LIMIT" in query
 
+    def test_drops_empty_partitions(self) -> None:
+        query, _ = build_partition_storage_query()
+        assert "HAVING bytes_on_disk > 0" in query
+
     def test_with_database(self) -> None:
         _, params = build_partition_storage_query(database="db2")
         assert params["database"] == "db2"
 
 
+class TestBuildClusterInfoQuery:
+    def test_single_scan_per_system_table(self) -> None:
+        query, params = build_cluster_info_query()
+        assert query.count("FROM system.tables") == 1
+        assert query.count("FROM system.parts") == 1
+        assert params == {}
+
+    def test_with_database(self) -> None:
+        query, params = build_cluster_info_query(database="db")
+        assert query.count("FROM system.tables") == 1
+        assert params == {"database": "db"}
+
+
 class TestBuildMvThroughputQuery:
     def test_default_hours_in_params(self) -> None:
         _, params = build_mv_throughput_query()
@@ -121,15 +155,16 @@ class TestBuildMvThroughputQuery:
         _, params = build_mv_throughput_query(hours=6)
         assert params["hours"] == 6
 
-    def test_database_pattern_filter(self) -> None:
+    def test_database_prefix_filter(self) -> None:
         query, params = build_mv_throughput_query(database="mydb")
-        assert "db_pattern" in params
-        assert params["db_pattern"] == "mydb.%"
-        assert "LIKE" in query
+        assert "db_prefix" in params
+        assert params["db_prefix"] == "mydb."
+        assert "startsWith(view_name, %(db_prefix)s)" in query
+        assert "LIKE" not in query
 
-    def test_no_database_no_pattern(self) -> None:
+    def test_no_database_no_prefix(self) -> None:
         query, params = build_mv_throughput_query()
-        assert "db_pattern" not in params
+        assert "db_prefix" not in params
 
 
 class TestBuildRecentThroughputQuery:
@@ -141,15 +176,30 @@ class TestBuildRecentThroughputQuery:
         _, params = build_recent_throughput_query(minutes=5)
         assert params["minutes"] == 5
 
-    def test_database_pattern(self) -> None:
+    def test_database_prefix(self) -> None:
         _, params = build_recent_throughput_query(database="db")
-        assert params["db_pattern"] == "db.%"
+        assert params["db_prefix"] == "db."
+
+
+class TestBuildThroughputTotalsQuery:
+    def test_aggregates_without_grouping(self) -> None:
+        query, _ = build_throughput_totals_query()
+        assert "sum(written_rows)" in query
+        assert "GROUP BY" not in query
+
+    def test_default_hours(self) -> None:
+        _, params = build_throughput_totals_query()
+        assert params["hours"] == 24
+
+    def test_database_prefix(self) -> None:
+        _, params = build_throughput_totals_query(database="db")
+        assert params["db_prefix"] == "db."
 
 
 class TestBuildMvErrorsQuery:
     def test_includes_exception_status(self) -> None:
         query, _ = build_mv_errors_query()
-        assert "ExceptionBeforeStart" in query or "Exception" in query
+        assert _EXCEPTION_STATUS_RE.search(query)
 
     def test_default_hours(self) -> None:
         _, params = build_mv_errors_query()
@@ -157,7 +207,7 @@ class TestBuildMvErrorsQuery:
 
     def test_with_database(self) -> None:
         _, params = build_mv_errors_query(database="prod")
-        assert params["db_pattern"] == "prod.%"
+        assert params["db_prefix"] == "prod."
 
 
 class TestBuildKafkaConsumersQuery:
@@ -169,6 +219,10 @@ class TestBuildKafkaConsumersQuery:
         query, params = build_kafka_consumers_query(database="kafka_db")
         assert params["database"] == "kafka_db"
 
+    def test_filter_applied_before_array_join(self) -> None:
+        query, _ = build_kafka_consumers_query(database="kafka_db")
+        assert query.index("database = %(database)s") < query.index("ARRAY JOIN")
+
     def test_without_database(self) -> None:
         _, params = build_kafka_consumers_query()
         assert params == {}
@@ -188,3 +242,18 @@ class TestBuildKafkaCheckQuery:
     def test_without_database(self) -> None:
         query, params = build_kafka_check_query()
         assert params == {}
+
+
+class TestBuildShowCreateQuery:
+    def test_quotes_identifiers(self) -> None:
+        query, params = build_show_create_query("db", "events")
+        assert query == "SHOW CREATE TABLE `db`.`events`"
+        assert params == {}
+
+    def test_escapes_backticks(self) -> None:
+        query, _ = build_show_create_query("db", "we`ird")
+        assert "`we\\`ird`" in query
+
+    def test_keeps_quoted_inner_table(self) -> None:
+        query, _ = build_show_create_query("db", "`.inner.mv`")
+        assert query.endswith("`db`.`.inner.mv`")